@@ -0,0 +1,13 @@
+#!/usr/bin/env python
+"""
+Load the Omron TM5 700 URDF model and display it
+
+Run with::
+
+    python examples/models/print_omron_tm5_700.py
+"""
+
+import roboticstoolbox as rtb
+
+robot = rtb.models.URDF.OmronTM5_700()
+print(robot)
@@ -1,8 +1,166 @@
 #!/usr/bin/env python
+"""
+Omron/Techman TM5 700 URDF model
 
+To load the model and print it, run the example
+``python examples/models/print_omron_tm5_700.py``.
+"""
+
+import os
+import re
+import copy
+import tempfile
+import warnings
 import numpy as np
+from pathlib import Path, PurePosixPath
+from spatialmath import SE3
+from spatialmath.base.argcheck import getmatrix
 from roboticstoolbox.robot.ERobot import ERobot
-from math import pi
+from roboticstoolbox.tools import xacro
+from roboticstoolbox.tools.data import path_to_datafile
+from roboticstoolbox.models.URDF import _OmronTM5_700_fk
+
+try:  # pragma: no cover
+    # compiled from _OmronTM5_700_fk_cy.pyx by setup.py if Cython is present
+    from roboticstoolbox.models.URDF import _OmronTM5_700_fk_cy as _fk_single
+except ImportError:  # pragma: no cover
+    _fk_single = _OmronTM5_700_fk
+
+# named joint configurations, shared by all instances
+_QZ = np.array([0, 0, 0, 0, 0, 0], dtype=np.float64)
+_QZ.setflags(write=False)
+_QR = np.array(
+    [-np.pi/4, 0, np.pi/2, 0, np.pi/2, np.pi], dtype=np.float64)
+_QR.setflags(write=False)
+
+try:  # pragma: no cover
+    import numba
+    _numba = True
+except ImportError:  # pragma: no cover
+    _numba = False
+
+if _numba:  # pragma: no cover
+    _fkine = numba.njit(cache=True, fastmath=True)(_OmronTM5_700_fk.fkine)
+
+    @numba.njit(parallel=True, cache=True, fastmath=True)
+    def _fkine_batch(Q, out):
+        for i in numba.prange(Q.shape[0]):
+            q = Q[i]
+            out[i] = _fkine(q[0], q[1], q[2], q[3], q[4], q[5])
+else:  # pragma: no cover
+    def _fkine_batch(Q, out):
+        for i in range(Q.shape[0]):
+            out[i] = _OmronTM5_700_fk.fkine(*Q[i])
+
+# absolute paths of the URDF files, keyed by path relative to the xacro folder
+_resolved_paths = {}
+
+
+def _resolve_package_path(file_path):
+    # locate the file within rtbdata once per process
+    try:
+        return _resolved_paths[file_path]
+    except KeyError:
+        path = path_to_datafile("xacro") / PurePosixPath(file_path)
+        _resolved_paths[file_path] = path
+        return path
+
+
+_include_re = re.compile(r'<xacro:include\s+filename="([^"]*)"')
+_find_re = re.compile(r"\$\(find\s+([^)\s]+)\)")
+
+
+def _xacro_includes(xacro_path):
+    # the xacro file and every file it includes, directly or indirectly.
+    # $(find pkg) is resolved to the package within the xacro folder, as the
+    # toolbox's xacro does, and other relative names to the including file
+    files = []
+    pending = [Path(xacro_path)]
+    while pending:
+        path = pending.pop()
+        if path in files or not path.exists():
+            continue
+        files.append(path)
+        for name in _include_re.findall(path.read_text()):
+            name = _find_re.sub(
+                lambda m: str(path_to_datafile("xacro") / m.group(1)), name)
+            pending.append(path.parent / name)
+    return files
+
+
+# dependencies of each xacro file, as {path: (files, key)}
+_xacro_deps = {}
+
+
+def _xacro_key(xacro_path):
+    """
+    Cache key for the expansion of a xacro file
+
+    :param xacro_path: absolute path of the xacro file
+    :type xacro_path: Path
+    :return: path and newest modification time of the file and its includes
+    :rtype: tuple(str, float)
+
+    The key changes when the xacro file, or any file it includes, is
+    modified.  The include set is found once and rescanned only when one of
+    its files changes, otherwise this costs one ``stat`` per file.
+    """
+    path = str(xacro_path)
+    files, key = _xacro_deps.get(path, (None, None))
+
+    if files is not None:
+        try:
+            mtime = max(os.path.getmtime(f) for f in files)
+        except OSError:
+            # an included file was removed
+            mtime = None
+        if mtime == key[1]:
+            return key
+
+    files = _xacro_includes(xacro_path)
+    key = (path, max(os.path.getmtime(f) for f in files))
+    _xacro_deps[path] = (files, key)
+    return key
+
+
+# configurations at which the generated forward kinematics are checked
+_QCHECK = np.array([
+    [0.1, -0.2, 0.3, -0.4, 0.5, -0.6],
+    [-1.2, 0.7, 1.9, -2.3, -0.8, 2.9]])
+
+
+def _fk_matches(robot):
+    # the generated code is a snapshot of the URDF, which ships separately in
+    # rtb-data, check that it still agrees with the general forward
+    # kinematics of the model
+    for q in _QCHECK:
+        T = robot.fkine(q, end="tool0").A
+        if not np.allclose(_OmronTM5_700_fk.fkine(*q), T) \
+                or not np.allclose(_fk_single.fkine(*q), T):
+            return False
+    return True
+
+
+def _clone_links(links):
+    # copy a robot's links so they can be given to a new ERobot.  The links
+    # must be in depth first order, as ERobot.links is, so that each parent's
+    # fast kinematics object is created before those of its children
+    clones = []
+    for link in links:
+        new = link.copy()
+        new._ets = copy.deepcopy(link._ets)
+        new._v = copy.deepcopy(link._v)
+        new._geometry = copy.deepcopy(link._geometry)
+        new._collision = copy.deepcopy(link._collision)
+
+        if link.parent is None:
+            new._init_fknm()
+        else:
+            # resolved by ERobot, which then creates the fknm object
+            new._parent = link.parent.name
+        clones.append(new)
+
+    return clones
 
 
 class OmronTM5_700(ERobot):
@@ -26,39 +184,396 @@ class OmronTM5_700(ERobot):
     - qs, arm is stretched out in the x-direction
     - qn, arm is at a nominal non-singular configuration
 
+    ``OmronTM5(dtype=np.float32)`` stores the configurations in
+    ``configs_matrix`` and computes ``fkine_batch`` in single precision, which
+    halves the memory traffic for large batches.  The default is
+    ``np.float64``.
+
 
     .. note:: The original file is from https://github.com/TechmanRobotInc/tmr_ros1/blob/master/tm5_description/urdf/tm5_700_robot.urdf.xacro
 
+    .. note:: The URDF file is only read when the kinematic model is first
+        used.
+
+    .. note:: ``fkine`` for the default end-effector uses straight-line code
+        generated from this model, see ``_OmronTM5_700_fk.py``.  If Cython
+        was available when the toolbox was built the compiled version,
+        ``_OmronTM5_700_fk_cy.pyx``, is used instead.  Run
+        ``python -m roboticstoolbox.tools.codegen`` to regenerate both if the
+        URDF changes.  The generated code is checked against the URDF when it
+        is first loaded, and if they disagree the general method is used.
+
+    .. note:: The xacro expansion of the URDF file is cached, in memory by
+        the class and on disk in a ``.expanded.urdf`` file next to the xacro
+        file.  Further instances copy the links of a prototype robot rather
+        than parsing the URDF again.  The expansion is redone if the xacro
+        file, or any file it includes, is modified.
+
+    .. note:: The visual and collision meshes are only referenced by
+        filename, the mesh files are read by the simulator or collision
+        checker when first needed, not when the model is loaded.
+
     .. codeauthor:: Jesse Haviland, mod. by Sebastian Schuetz
     .. sectionauthor:: Peter Corke
     """
 
-    def __init__(self):
+    # expanded URDF string, as (_xacro_key(xacro path), urdf_string)
+    _urdf_cache = None
+
+    # robot built from the URDF, as (_xacro_key(xacro path), ERobot, name,
+    # True if the generated forward kinematics agree with it)
+    _prototype = None
+
+    def __init__(self, dtype=np.float64):
+
+        # the URDF model is read on first use, see _ensure_loaded
+        self._loaded = False
+
+        # floating point type of configs_matrix and fkine_batch
+        self._dtype = np.dtype(dtype)
+        if self._dtype not in (np.float32, np.float64):
+            raise ValueError("dtype must be float32 or float64")
+
+        self.manufacturer = "Omron"
+
+        # forward kinematics generated by roboticstoolbox.tools.codegen, from
+        # the base to the default end-effector
+        self._fk_specialized = _fk_single.fkine
+        self._fk_specialized_end = "tool0"
+
+        self._pending_configs = [
+            # zero angles, straight standing up
+            ("qz", _QZ),
+
+            # ready pose, arm 90°
+            ("qr", _QR),
+        ]
+
+        # TODO: straight and horizontal (qs) and nominal table top picking
+        # pose (qn) should be distinct poses, for now they are the same as qr
+        self._pending_aliases = [("qs", "qr"), ("qn", "qr")]
+
+    def __getattr__(self, name):
+        # only invoked for attributes which are not set, which before loading
+        # includes everything provided by ERobot
+        if name.startswith("__") or self.__dict__.get("_loaded", True):
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        self._ensure_loaded()
+        return getattr(self, name)
+
+    def _ensure_loaded(self):
+        """
+        Read the URDF model if not already done
+
+        The robot is constructed lazily: ``OmronTM5_700()`` only sets up
+        metadata such as ``manufacturer``, and the URDF is read the first time
+        any other attribute, eg. ``links`` or ``qr``, is accessed.  Attributes
+        assigned before that point are retained.
+        """
+        if self._loaded:
+            return
+        self._loaded = True
 
-        links, name = self.URDF_read(
+        preset = dict(self.__dict__)
+        pending = preset.pop("_pending_configs")
+        aliases = preset.pop("_pending_aliases")
+
+        links, name, fk_valid = self._prototype_links(
             "tm5_description/urdf/tm5_700_robot.urdf.xacro")
 
         super().__init__(
             links,
-            name=name)
+            name=name,
+            manufacturer="Omron")
+
+        self.__dict__.update(preset)
+        del self._pending_configs
+
+        if not fk_valid:
+            # the URDF has changed since the code was generated
+            self._fk_specialized = None
+        del self._pending_aliases
 
-        self.manufacturer = "Omron"
         # self.ee_link = self.ets[9]
 
-        # zero angles, straight standing up
-        self.addconfiguration("qz", np.array([0, 0, 0, 0, 0, 0]))
+        # storage for the named configurations, one per row, grown as needed
+        self._config_buffer = np.zeros((8, self.n), dtype=self._dtype)
+        self._config_names = {}
+
+        # pose of tool0 for each named configuration, excluding base and
+        # tool, as {id(view): (name, view, T)}
+        self._fk_cache = {}
+
+        for name, q in pending:
+            self.addconfiguration(name, q)
+        for name, existing in aliases:
+            self.add_configuration_alias(name, existing)
+
+    def addconfiguration(self, name, q, unit='rad'):
+        """
+        Add a named joint configuration
+
+        :param name: Name of the joint configuration
+        :type name: str
+        :param q: Joint configuration
+        :type q: ndarray(n) or list
+
+        As for :func:`Robot.addconfiguration` except that the configurations
+        are stored as rows of a single array, see :func:`configs_matrix`, and
+        the named attribute is a read-only view of its row.
+        """
+        super().addconfiguration(name, q, unit)
+
+        i = self._config_names.get(name)
+        if i is None:
+            i = len(self._config_names)
+            if i == self._config_buffer.shape[0]:
+                self._grow_config_buffer()
+            self._config_names[name] = i
+
+        self._config_buffer[i] = self._configdict[name]
+        self._set_config_view(name, i)
+
+    def _grow_config_buffer(self):
+        # double the capacity, and move the existing views to the new buffer
+        buffer = np.zeros(
+            (2 * self._config_buffer.shape[0], self.n), dtype=self._dtype)
+        buffer[:self._config_buffer.shape[0]] = self._config_buffer
+        self._config_buffer = buffer
+
+        for name, i in self._config_names.items():
+            self._set_config_view(name, i)
+
+    def _set_config_view(self, name, i):
+        view = self._config_buffer[i]
+        view.setflags(write=False)
+        self._configdict[name] = view
+        setattr(self, name, view)
+
+        self._fk_cache = {
+            k: v for k, v in self._fk_cache.items() if v[0] != name}
+        if self._fk_specialized is not None:
+            self._fk_cache[id(view)] = (
+                name, view, self._fk_specialized(*view))
+
+        self._update_aliases(name)
+
+    @property
+    def configs_matrix(self):
+        """
+        Named configurations as a single array
+
+        :return: named configurations, one per row
+        :rtype: ndarray(k,n), of the robot's dtype
+
+        The rows are in the order the configurations were added, starting
+        with ``qz`` and ``qr``.  Aliases, such as ``qs`` and ``qn``, share
+        the row of the configuration they refer to.  The named configuration
+        attributes, eg. ``robot.qr``, are read-only views of the rows of this
+        array, which can be passed as a batch to trajectory methods such as
+        ``fkine``.
+
+        Example:
+
+        .. runblock:: pycon
+
+            >>> import roboticstoolbox as rtb
+            >>> robot = rtb.models.URDF.OmronTM5_700()
+            >>> robot.fkine(robot.configs_matrix)
+        """
+        return self._config_buffer[:len(self._config_names)]
+
+    def fkine(
+        self,
+        q,
+        unit="rad",
+        end=None,
+        start=None,
+        tool=None,
+        include_base=True,
+        fast=False,
+    ):
+        """
+        Forward kinematics
+
+        As for :func:`ERobot.fkine` except that the end-effector poses of the
+        named configurations are precomputed, so ``robot.fkine(robot.qr)``
+        does not evaluate the kinematics.  The cache is keyed on the named
+        configuration attribute itself, not its value, and the robot's base
+        and tool transforms are applied on each call.  It holds the poses of
+        the ``tool0`` link and is not used if the end-effector has been
+        changed, a gripper attached, or ``end``, ``start`` or ``tool`` is
+        given.
+        """
+        cached = self._fk_cache.get(id(q))
+
+        if cached is None or cached[1] is not q or unit != "rad" \
+                or end is not None or start is not None or tool is not None \
+                or fast or self._get_fk_specialized(
+                    *self._get_limit_links()) is None:
+            return super().fkine(
+                q, unit=unit, end=end, start=start, tool=tool,
+                include_base=include_base, fast=fast)
+
+        T = cached[2]
+        if self._tool is not None:
+            T = T @ self._tool.A
+        if self._base is not None:
+            T = self._base.A @ T
+
+        return SE3(T, check=False)
+
+    def fkine_batch(self, Q):
+        """
+        Forward kinematics for many configurations
+
+        :param Q: Joint coordinates, one configuration per row
+        :type Q: ndarray(m,6)
+        :return: Pose of the end-effector for each configuration
+        :rtype: ndarray(m,4,4), of the robot's dtype
+
+        Evaluates the generated forward kinematics for the default
+        end-effector over all rows of ``Q`` and returns a plain array rather
+        than an ``SE3`` instance.  If Numba is installed this is a compiled
+        loop which runs in parallel across cores, otherwise it is a Python
+        loop.  The robot's base and tool transforms, if set, are included.
+
+        If ``Q`` is a CUDA array, eg. a ``cupy.ndarray``, the computation is
+        done on the GPU by a Numba CUDA kernel with one thread per
+        configuration, and the result is returned as a ``cupy.ndarray``.
+
+        If the generated code does not apply, eg. the end-effector has been
+        changed, the general method is used for each row of ``Q``.
+        This requires Numba and CuPy with CUDA support.
+
+        Example:
+
+        .. runblock:: pycon
+
+            >>> import roboticstoolbox as rtb
+            >>> robot = rtb.models.URDF.OmronTM5_700()
+            >>> T = robot.fkine_batch(robot.configs_matrix)
+            >>> T.shape
+
+        :seealso: :func:`fkine`
+        """
+        if self._get_fk_specialized(*self._get_limit_links()) is None:
+            # the generated code does not apply, see fkine
+            if hasattr(Q, "__cuda_array_interface__"):  # pragma: no cover
+                raise ValueError(
+                    "the generated forward kinematics are not valid for "
+                    "this robot, use a NumPy array")
+            T = super().fkine(getmatrix(Q, (None, self.n)))
+            return np.array(
+                [Tk.A for Tk in T], dtype=self._dtype).reshape(-1, 4, 4)
+
+        if hasattr(Q, "__cuda_array_interface__"):  # pragma: no cover
+            from roboticstoolbox.models.URDF import _OmronTM5_700_fk_cuda
+
+            return _OmronTM5_700_fk_cuda.fkine_batch(
+                Q,
+                base=None if self._base is None else self._base.A,
+                tool=None if self._tool is None else self._tool.A,
+                dtype=self._dtype)
+
+        Q = getmatrix(Q, (None, self.n))
+        Q = np.ascontiguousarray(Q, dtype=self._dtype)
+
+        T = np.empty((Q.shape[0], 4, 4), dtype=self._dtype)
+        _fkine_batch(Q, T)
+
+        if self._base is not None:
+            T = self._base.A.astype(self._dtype) @ T
+        if self._tool is not None:
+            T = T @ self._tool.A.astype(self._dtype)
+
+        return T
+
+    @classmethod
+    def _prototype_links(cls, file_path):
+        """
+        Links for a new instance, copied from a prototype robot
+
+        :param file_path: File path relative to the xacro folder
+        :type file_path: str, in Posix file path format
+        :return: Links, robot name, and whether the generated forward
+            kinematics agree with the links
+        :rtype: tuple(ELink list, str, bool)
+
+        The URDF is parsed into a prototype robot once, and each instance is
+        given a copy of its links.  Links cannot be shared between robots
+        since they hold the joint state and pose of the geometry.  The
+        prototype is rebuilt if the xacro file, or any file it includes, is
+        modified.
+
+        When the prototype is built the generated forward kinematics are
+        checked against it.  If they disagree, because the URDF has changed
+        since the code was generated, a warning is given and the general
+        method is used instead.
+        """
+        key = _xacro_key(_resolve_package_path(file_path))
+
+        if cls._prototype is None or cls._prototype[0] != key:
+            links, name = cls._URDF_read_cached(file_path)
+            prototype = ERobot(links, name=name)
+            fk_valid = _fk_matches(prototype)
+            if not fk_valid:
+                warnings.warn(
+                    "generated forward kinematics do not match the URDF, "
+                    "using the general method.  Regenerate them with "
+                    "python -m roboticstoolbox.tools.codegen")
+            cls._prototype = (key, prototype, name, fk_valid)
+
+        _, prototype, name, fk_valid = cls._prototype
+        return _clone_links(prototype.links), name, fk_valid
+
+    @classmethod
+    def _URDF_read_cached(cls, file_path):
+        """
+        Read the URDF file as ELinks, reusing a cached xacro expansion
 
-        # ready pose, arm 90°
-        self.addconfiguration("qr", np.array([-pi/4, 0, pi/2, 0, pi/2, pi]))
+        :param file_path: File path relative to the xacro folder
+        :type file_path: str, in Posix file path format
+        :return: Links and robot name
+        :rtype: tuple(ELink list, str)
 
-        # straight and horizontal -> same as qr
-        self.addconfiguration("qs", np.array([-pi/4, 0, pi/2, 0, pi/2, pi]))
+        The expanded URDF string is looked for in the class cache, then in
+        the ``.expanded.urdf`` file next to the xacro file.  The xacro
+        preprocessor is only run if neither is up to date, and its result is
+        written to both.  The ELinks are always created afresh since they
+        cannot be shared between robot instances.
+        """
+        xacro_path = _resolve_package_path(file_path)
+        key = _xacro_key(xacro_path)
 
-        # nominal table top picking pose -> same as qr
-        self.addconfiguration("qn", np.array([-pi/4, 0, pi/2, 0, pi/2, pi]))
+        if cls._urdf_cache is None or cls._urdf_cache[0] != key:
+            cache_path = str(xacro_path) + ".expanded.urdf"
 
+            # newer than the xacro file and everything it includes
+            if os.path.exists(cache_path) \
+                    and os.path.getmtime(cache_path) >= key[1]:
+                with open(cache_path) as f:
+                    urdf_string = f.read()
+            else:
+                urdf_string = xacro.main(xacro_path)
+                try:
+                    # write a temporary file and rename it, so that another
+                    # process never reads a partially written file
+                    fd, tmp_path = tempfile.mkstemp(
+                        dir=os.path.dirname(cache_path), suffix=".tmp")
+                    try:
+                        with os.fdopen(fd, "w") as f:
+                            f.write(urdf_string)
+                        os.replace(tmp_path, cache_path)
+                    except OSError:
+                        os.remove(tmp_path)
+                        raise
+                except OSError:
+                    # data folder is read only, keep the in-memory copy
+                    pass
 
-if __name__ == '__main__':   # pragma nocover
+            cls._urdf_cache = (key, urdf_string)
 
-    robot = OmronTM5_700()
-    print(robot)
+        return cls.URDF_read_string(cls._urdf_cache[1], xacro_path)
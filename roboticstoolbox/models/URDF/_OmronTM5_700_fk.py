@@ -0,0 +1,130 @@
+# flake8: noqa
+"""
+Forward kinematics for the OmronTM5_700 robot
+
+Generated by roboticstoolbox.tools.codegen, do not edit.  The constant link
+transforms are folded into the expressions, only the joint coordinates
+remain as variables.
+"""
+
+from math import sin, cos
+import numpy as np
+
+
+def fkine(q0, q1, q2, q3, q4, q5):
+    x0 = sin(q5)
+    x1 = cos(q3)
+    x2 = cos(q0)
+    x3 = sin(q1)
+    x4 = cos(q2)
+    x5 = x3*x4
+    x6 = x2*x5
+    x7 = sin(q2)
+    x8 = cos(q1)
+    x9 = x7*x8
+    x10 = x2*x9
+    x11 = x10 + x6
+    x12 = x1*x11
+    x13 = sin(q3)
+    x14 = x3*x7
+    x15 = -x14*x2 + x2*x4*x8
+    x16 = x13*x15
+    x17 = x12 + x16
+    x18 = cos(q5)
+    x19 = sin(q0)
+    x20 = sin(q4)
+    x21 = cos(q4)
+    x22 = x1*x15 - x11*x13
+    x23 = -x19*x20 + x21*x22
+    x24 = x19*x21
+    x25 = x20*x22
+    x26 = 0.329*x3
+    x27 = x19*x5
+    x28 = x19*x9
+    x29 = x27 + x28
+    x30 = x1*x29
+    x31 = -x14*x19 + x19*x4*x8
+    x32 = x13*x31
+    x33 = x30 + x32
+    x34 = x1*x31 - x13*x29
+    x35 = x2*x20 + x21*x34
+    x36 = x2*x21
+    x37 = x20*x34
+    x38 = -x14 + x4*x8
+    x39 = x1*x38
+    x40 = -x5 - x9
+    x41 = x13*x40
+    x42 = x39 + x41
+    x43 = x1*x40 - x13*x38
+    x44 = x21*x43
+    x45 = x20*x43
+    return np.array([
+        [x0*x17 + x18*x23, -x0*x23 + x17*x18, x24 + x25, 0.3115*x10 + 0.106*x12 + 0.106*x16 + 0.1223*x19 + x2*x26 + 0.26415*x24 + 0.26415*x25 + 0.3115*x6],
+        [x0*x33 + x18*x35, -x0*x35 + x18*x33, -x36 + x37, x19*x26 - 0.1223*x2 + 0.3115*x27 + 0.3115*x28 + 0.106*x30 + 0.106*x32 - 0.26415*x36 + 0.26415*x37],
+        [x0*x42 + x18*x44, -x0*x44 + x18*x42, x45, -0.3115*x14 + 0.106*x39 + 0.3115*x4*x8 + 0.106*x41 + 0.26415*x45 + 0.329*x8 + 0.1452],
+        [0.0, 0.0, 0.0, 1.0]])
+
+
+def fkine_out(q0, q1, q2, q3, q4, q5, T):
+    x0 = sin(q5)
+    x1 = cos(q3)
+    x2 = cos(q0)
+    x3 = sin(q1)
+    x4 = cos(q2)
+    x5 = x3*x4
+    x6 = x2*x5
+    x7 = sin(q2)
+    x8 = cos(q1)
+    x9 = x7*x8
+    x10 = x2*x9
+    x11 = x10 + x6
+    x12 = x1*x11
+    x13 = sin(q3)
+    x14 = x3*x7
+    x15 = -x14*x2 + x2*x4*x8
+    x16 = x13*x15
+    x17 = x12 + x16
+    x18 = cos(q5)
+    x19 = sin(q0)
+    x20 = sin(q4)
+    x21 = cos(q4)
+    x22 = x1*x15 - x11*x13
+    x23 = -x19*x20 + x21*x22
+    x24 = x19*x21
+    x25 = x20*x22
+    x26 = 0.329*x3
+    x27 = x19*x5
+    x28 = x19*x9
+    x29 = x27 + x28
+    x30 = x1*x29
+    x31 = -x14*x19 + x19*x4*x8
+    x32 = x13*x31
+    x33 = x30 + x32
+    x34 = x1*x31 - x13*x29
+    x35 = x2*x20 + x21*x34
+    x36 = x2*x21
+    x37 = x20*x34
+    x38 = -x14 + x4*x8
+    x39 = x1*x38
+    x40 = -x5 - x9
+    x41 = x13*x40
+    x42 = x39 + x41
+    x43 = x1*x40 - x13*x38
+    x44 = x21*x43
+    x45 = x20*x43
+    T[0, 0] = x0*x17 + x18*x23
+    T[0, 1] = -x0*x23 + x17*x18
+    T[0, 2] = x24 + x25
+    T[0, 3] = 0.3115*x10 + 0.106*x12 + 0.106*x16 + 0.1223*x19 + x2*x26 + 0.26415*x24 + 0.26415*x25 + 0.3115*x6
+    T[1, 0] = x0*x33 + x18*x35
+    T[1, 1] = -x0*x35 + x18*x33
+    T[1, 2] = -x36 + x37
+    T[1, 3] = x19*x26 - 0.1223*x2 + 0.3115*x27 + 0.3115*x28 + 0.106*x30 + 0.106*x32 - 0.26415*x36 + 0.26415*x37
+    T[2, 0] = x0*x42 + x18*x44
+    T[2, 1] = -x0*x44 + x18*x42
+    T[2, 2] = x45
+    T[2, 3] = -0.3115*x14 + 0.106*x39 + 0.3115*x4*x8 + 0.106*x41 + 0.26415*x45 + 0.329*x8 + 0.1452
+    T[3, 0] = 0.0
+    T[3, 1] = 0.0
+    T[3, 2] = 0.0
+    T[3, 3] = 1.0
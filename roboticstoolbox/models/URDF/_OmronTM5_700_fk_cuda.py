@@ -0,0 +1,58 @@
+"""
+CUDA forward kinematics for the OmronTM5_700 robot
+
+Requires Numba with CUDA support, and CuPy for the array handling.  This
+module is only imported by ``OmronTM5_700.fkine_batch`` when it is given a
+CUDA array.  The constant link transforms are folded into the generated
+expressions of ``_OmronTM5_700_fk`` so the kernel has no table to load.
+"""
+
+import numpy as np
+from numba import cuda
+import cupy as cp
+from roboticstoolbox.models.URDF import _OmronTM5_700_fk
+
+_fkine = cuda.jit(device=True)(_OmronTM5_700_fk.fkine_out)
+
+# threads per block
+_THREADS = 128
+
+
+@cuda.jit
+def tm5_fk_fused(Q, T_out):
+    # one thread per configuration
+    i = cuda.grid(1)
+    if i < Q.shape[0]:
+        _fkine(Q[i, 0], Q[i, 1], Q[i, 2], Q[i, 3], Q[i, 4], Q[i, 5], T_out[i])
+
+
+def fkine_batch(Q, base=None, tool=None, dtype=np.float64):
+    """
+    Forward kinematics for many configurations on the GPU
+
+    :param Q: Joint coordinates, one configuration per row
+    :type Q: CUDA array(m,6)
+    :param base: base transform, optional
+    :type base: ndarray(4,4)
+    :param tool: tool transform, optional
+    :type tool: ndarray(4,4)
+    :param dtype: floating point type of the computation
+    :type dtype: numpy dtype
+    :return: Pose of the end-effector for each configuration
+    :rtype: cupy.ndarray(m,4,4)
+    """
+    Q = cp.ascontiguousarray(cp.asarray(Q), dtype=dtype)
+    if Q.ndim != 2 or Q.shape[1] != 6:
+        raise ValueError("Q must have shape (m,6)")
+
+    T = cp.empty((Q.shape[0], 4, 4), dtype=dtype)
+    if Q.shape[0] > 0:
+        blocks = (Q.shape[0] + _THREADS - 1) // _THREADS
+        tm5_fk_fused[blocks, _THREADS](Q, T)
+
+    if base is not None:
+        T = cp.asarray(base, dtype=dtype) @ T
+    if tool is not None:
+        T = T @ cp.asarray(tool, dtype=dtype)
+
+    return T
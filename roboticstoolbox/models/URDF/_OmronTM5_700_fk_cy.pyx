@@ -0,0 +1,80 @@
+# cython: boundscheck=False, wraparound=False, language_level=3
+"""
+Forward kinematics for the OmronTM5_700 robot, compiled with Cython
+
+Generated by roboticstoolbox.tools.codegen, do not edit.  The same
+expressions as the Python module, with typed locals and C math functions.
+"""
+
+from libc.math cimport sin, cos
+import numpy as np
+
+
+def fkine(double q0, double q1, double q2, double q3, double q4, double q5):
+    cdef double x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12, x13, x14, x15, x16, x17, x18, x19, x20, x21, x22, x23, x24, x25, x26, x27, x28, x29, x30, x31, x32, x33, x34, x35, x36, x37, x38, x39, x40, x41, x42, x43, x44, x45
+    T = np.empty((4, 4))
+    cdef double[:, ::1] Tv = T
+
+    x0 = sin(q5)
+    x1 = cos(q3)
+    x2 = cos(q0)
+    x3 = sin(q1)
+    x4 = cos(q2)
+    x5 = x3*x4
+    x6 = x2*x5
+    x7 = sin(q2)
+    x8 = cos(q1)
+    x9 = x7*x8
+    x10 = x2*x9
+    x11 = x10 + x6
+    x12 = x1*x11
+    x13 = sin(q3)
+    x14 = x3*x7
+    x15 = -x14*x2 + x2*x4*x8
+    x16 = x13*x15
+    x17 = x12 + x16
+    x18 = cos(q5)
+    x19 = sin(q0)
+    x20 = sin(q4)
+    x21 = cos(q4)
+    x22 = x1*x15 - x11*x13
+    x23 = -x19*x20 + x21*x22
+    x24 = x19*x21
+    x25 = x20*x22
+    x26 = 0.329*x3
+    x27 = x19*x5
+    x28 = x19*x9
+    x29 = x27 + x28
+    x30 = x1*x29
+    x31 = -x14*x19 + x19*x4*x8
+    x32 = x13*x31
+    x33 = x30 + x32
+    x34 = x1*x31 - x13*x29
+    x35 = x2*x20 + x21*x34
+    x36 = x2*x21
+    x37 = x20*x34
+    x38 = -x14 + x4*x8
+    x39 = x1*x38
+    x40 = -x5 - x9
+    x41 = x13*x40
+    x42 = x39 + x41
+    x43 = x1*x40 - x13*x38
+    x44 = x21*x43
+    x45 = x20*x43
+    Tv[0, 0] = x0*x17 + x18*x23
+    Tv[0, 1] = -x0*x23 + x17*x18
+    Tv[0, 2] = x24 + x25
+    Tv[0, 3] = 0.3115*x10 + 0.106*x12 + 0.106*x16 + 0.1223*x19 + x2*x26 + 0.26415*x24 + 0.26415*x25 + 0.3115*x6
+    Tv[1, 0] = x0*x33 + x18*x35
+    Tv[1, 1] = -x0*x35 + x18*x33
+    Tv[1, 2] = -x36 + x37
+    Tv[1, 3] = x19*x26 - 0.1223*x2 + 0.3115*x27 + 0.3115*x28 + 0.106*x30 + 0.106*x32 - 0.26415*x36 + 0.26415*x37
+    Tv[2, 0] = x0*x42 + x18*x44
+    Tv[2, 1] = -x0*x44 + x18*x42
+    Tv[2, 2] = x45
+    Tv[2, 3] = -0.3115*x14 + 0.106*x39 + 0.3115*x4*x8 + 0.106*x41 + 0.26415*x45 + 0.329*x8 + 0.1452
+    Tv[3, 0] = 0.0
+    Tv[3, 1] = 0.0
+    Tv[3, 2] = 0.0
+    Tv[3, 3] = 1.0
+    return T
@@ -3,10 +3,12 @@
 @author: Jesse Haviland
 """
 
+import math
 import numpy as np
 from spatialmath import SE3
+from spatialmath.base import getvector
 import roboticstoolbox as rp
-from roboticstoolbox.robot.Link import Link, _listen_dyn
+from roboticstoolbox.robot.Link import Link
 from roboticstoolbox.robot.ETS import ETS
 
 _eps = np.finfo(np.float64).eps
@@ -19,8 +21,9 @@ def _check_rne(func):
     Decorator applied to any method to calls to C RNE code.  Works in
     conjunction with::
 
-        @_listen_dyn
         def dyn_param_setter(self, value):
+            ...
+            self._notify()
 
     which marks the dynamic parameters as having changed using the robot's
     ``.dynchanged()`` method.
@@ -28,7 +31,7 @@ def _check_rne(func):
     If this is the case, then the parameters are re-serialized prior to
     invoking inverse dynamics.
 
-    :seealso: :func:`Link._listen_dyn`
+    :seealso: :func:`Link._notify`
     """
     @wraps(func)
     def wrapper_check_rne(*args, **kwargs):
@@ -65,6 +68,119 @@ def _sin(theta):
     else:
         return np.sin(theta)
 
+
+def _sincos_alpha(alpha):
+    # sine and cosine of a link twist.  Almost every robot has twists that
+    # are multiples of pi/2, these give exact 0 and ±1 so that the terms
+    # they multiply vanish rather than leaving residuals like 6e-17
+    if not _issymbol(alpha):
+        k = round(alpha / (math.pi / 2))
+        if abs(alpha - k * math.pi / 2) < 1e-12:
+            return (0.0, 1.0, 0.0, -1.0)[k % 4], (1.0, 0.0, -1.0, 0.0)[k % 4]
+    return _sin(alpha), _cos(alpha)
+
+# --------------------------------------------------------------#
+
+try:  # pragma: no cover
+    # ahead-of-time compiled kernels, no JIT warmup
+    from roboticstoolbox.robot import _dhlink_c
+    _cython = True
+except ImportError:  # pragma: no cover
+    _cython = False
+
+try:  # pragma: no cover
+    import numba
+    _numba = True
+except ImportError:  # pragma: no cover
+    _numba = False
+
+
+# Python fallback, skips the terms that vanish when the twist is a multiple
+# of pi/2, ie. sa or ca is exactly 0.  The skipped elements are already zero
+# in the copy of DHLink._T_const
+def _A_sdh_py(ca, sa, ct, st, a, out):
+    out[0, 0] = ct
+    out[0, 3] = a * ct
+    out[1, 0] = st
+    out[1, 3] = a * st
+    if sa != 0.0:
+        out[0, 2] = st * sa
+        out[1, 2] = -ct * sa
+    if ca != 0.0:
+        out[0, 1] = -st * ca
+        out[1, 1] = ct * ca
+
+
+def _A_mdh_py(ca, sa, ct, st, out):
+    out[0, 0] = ct
+    out[0, 1] = -st
+    if ca != 0.0:
+        out[1, 0] = st * ca
+        out[1, 1] = ct * ca
+    if sa != 0.0:
+        out[2, 0] = st * sa
+        out[2, 1] = ct * sa
+
+
+if _cython:  # pragma: no cover
+    _A_sdh = _dhlink_c.A_sdh
+    _A_mdh = _dhlink_c.A_mdh
+
+elif _numba:  # pragma: no cover
+    # compiled fill of the joint dependent elements of a revolute link
+    # transform, the other elements are copied from DHLink._T_const
+
+    @numba.njit(cache=True)
+    def _A_sdh(ca, sa, ct, st, a, out):
+        out[0, 0] = ct
+        out[0, 1] = -st * ca
+        out[0, 2] = st * sa
+        out[0, 3] = a * ct
+        out[1, 0] = st
+        out[1, 1] = ct * ca
+        out[1, 2] = -ct * sa
+        out[1, 3] = a * st
+
+    @numba.njit(cache=True)
+    def _A_mdh(ca, sa, ct, st, out):
+        out[0, 0] = ct
+        out[0, 1] = -st
+        out[1, 0] = st * ca
+        out[1, 1] = ct * ca
+        out[2, 0] = st * sa
+        out[2, 1] = ct * sa
+
+else:  # pragma: no cover
+    _A_sdh = _A_sdh_py
+    _A_mdh = _A_mdh_py
+
+
+# fill the joint dependent elements of a link transform, one function per
+# joint type and convention, chosen along with DHLink._T_const
+def _A_revolute_sdh(link, q, out):
+    # math is faster than NumPy for a scalar
+    _A_sdh(link._ca, link._sa, math.cos(q), math.sin(q), link._a, out)
+
+
+def _A_revolute_mdh(link, q, out):
+    _A_mdh(link._ca, link._sa, math.cos(q), math.sin(q), out)
+
+
+def _A_prismatic_sdh(link, q, out):
+    out[2, 3] = q
+
+
+def _A_prismatic_mdh(link, q, out):
+    out[1, 3] = -link._sa * q
+    out[2, 3] = link._ca * q
+
+
+_A_fill = {
+    (0, 0): _A_revolute_sdh,
+    (0, 1): _A_revolute_mdh,
+    (1, 0): _A_prismatic_sdh,
+    (1, 1): _A_prismatic_mdh}
+
 # --------------------------------------------------------------#
 
 
@@ -115,6 +231,11 @@ class DHLink(Link):
 
     """
 
+    __slots__ = (
+        '_theta', '_d', '_a', '_alpha', '_sigma', '_mdh', '_offset', 'id',
+        'number', 'jindex', '_sa', '_ca', '_st_fixed', '_ct_fixed',
+        '_T_const', '_A_fn', '_flip_sign', '_qidentity')
+
     def __init__(
             self,
             d=0.0,
@@ -147,6 +268,83 @@ class DHLink(Link):
         # for compatibiity with ELink
         return True
 
+    @staticmethod
+    def pack_chain(links):
+        """
+        Kinematic parameters of a chain of links as an array
+
+        :param links: the links of a serial chain
+        :type links: iterable of DHLink
+        :return: parameters, one row per link, or None if any is symbolic
+        :rtype: ndarray(n,7)
+
+        The columns are ``a``, ``alpha``, ``theta``, ``d``, ``sigma``,
+        ``offset`` and ``flip``.  This is the form of the chain consumed by
+        compiled or vectorized forward kinematics, which loop over the
+        rows rather than calling a method of each link object.
+
+        :seealso: :func:`DHRobot.fkine_fused`
+        """
+        P = np.array([
+            (L._a, L._alpha, L._theta, L._d, L._sigma, L._offset, L._flip)
+            for L in links])
+        if P.dtype.kind == 'O':
+            return None
+        return P.astype(np.float64)
+
+    @staticmethod
+    def chain_to_tensor(links, backend='torch', device=None, dtype=None):
+        """
+        Kinematic parameters of a chain of links as a tensor
+
+        :param links: the links of a serial chain
+        :type links: iterable of DHLink
+        :param backend: array library, 'torch', 'jax' or 'numpy'
+        :type backend: str
+        :param device: PyTorch device for the tensor
+        :type device: str or torch.device
+        :param dtype: element type, defaults to the backend's default
+            floating point type
+        :return: parameters, one row per link
+        :rtype: torch.Tensor(n,7), jax.Array(n,7) or ndarray(n,7)
+        :raises ValueError: if any parameter is symbolic
+
+        As for :func:`pack_chain` but converted to a tensor of the given
+        array library, so that forward kinematics for a batch of
+        configurations can be written with tensor operations and run on a
+        GPU.  This is the layout used by :func:`DHRobot.fkine_torch` and
+        :func:`DHRobot.fkine_jax`.  The array library is only imported when
+        requested.
+
+        :seealso: :func:`pack_chain`
+        """
+        P = DHLink.pack_chain(links)
+        if P is None:
+            raise ValueError("link parameters must be numeric")
+
+        if backend == 'torch':
+            try:
+                import torch
+            except ImportError:  # pragma: no cover
+                raise ImportError(
+                    "PyTorch is required for the torch backend, "
+                    "install using pip install torch")
+            if dtype is None:
+                dtype = torch.get_default_dtype()
+            return torch.as_tensor(P, device=device, dtype=dtype)
+        elif backend == 'jax':
+            try:
+                import jax.numpy as jnp
+            except ImportError:  # pragma: no cover
+                raise ImportError(
+                    "JAX is required for the jax backend, "
+                    "install using pip install jax")
+            return jnp.asarray(P, dtype=dtype)
+        elif backend == 'numpy':
+            return P if dtype is None else P.astype(dtype)
+        else:
+            raise ValueError(f"unknown backend {backend}")
+
     def __add__(self, L):
         if isinstance(L, DHLink):
             return rp.DHRobot([self, L])
@@ -219,12 +417,17 @@ class DHLink(Link):
         return self._theta
 
     @theta.setter
-    @_listen_dyn
     def theta(self, theta_new):
         if not self.sigma and theta_new != 0.0:
             raise ValueError("theta is not valid for revolute joints")
         else:
             self._theta = theta_new
+            self._T_const = None
+
+            # constant for a prismatic joint, used by A()
+            self._st_fixed = _sin(theta_new)
+            self._ct_fixed = _cos(theta_new)
+        self._notify()
 
 # -------------------------------------------------------------------------- #
 
@@ -242,12 +445,13 @@ class DHLink(Link):
         return self._d
 
     @d.setter
-    @_listen_dyn
     def d(self, d_new):
         if self.sigma and d_new != 0.0:
             raise ValueError("f is not valid for prismatic joints")
         else:
             self._d = d_new
+            self._T_const = None
+        self._notify()
 
 # -------------------------------------------------------------------------- #
 
@@ -265,9 +469,10 @@ class DHLink(Link):
         return self._a
 
     @a.setter
-    @_listen_dyn
     def a(self, a_new):
         self._a = a_new
+        self._T_const = None
+        self._notify()
 # -------------------------------------------------------------------------- #
 
     @property
@@ -284,9 +489,27 @@ class DHLink(Link):
         return self._alpha
 
     @alpha.setter
-    @_listen_dyn
     def alpha(self, alpha_new):
         self._alpha = alpha_new
+        self._T_const = None
+
+        # constant, used by A()
+        self._sa, self._ca = _sincos_alpha(alpha_new)
+        self._notify()
+
+    @property
+    def trig_alpha(self):
+        r"""
+        Cosine and sine of link twist
+
+        :return: cosine and sine of the link twist
+        :rtype: tuple(float, float)
+
+        These are computed once, when the twist is set, and used by
+        :func:`A` for every joint value.  Twists that are multiples of
+        :math:`\pi/2` give exact values of 0 and ±1.
+        """
+        return self._ca, self._sa
 
 # -------------------------------------------------------------------------- #
 
@@ -307,9 +530,10 @@ class DHLink(Link):
         return self._sigma
 
     @sigma.setter
-    @_listen_dyn
     def sigma(self, sigma_new):
         self._sigma = sigma_new
+        self._T_const = None
+        self._notify()
 # -------------------------------------------------------------------------- #
 
     @property
@@ -329,9 +553,10 @@ class DHLink(Link):
         return self._mdh
 
     @mdh.setter
-    @_listen_dyn
     def mdh(self, mdh_new):
         self._mdh = int(mdh_new)
+        self._T_const = None
+        self._notify()
 
 # -------------------------------------------------------------------------- #
 
@@ -357,9 +582,70 @@ class DHLink(Link):
     @offset.setter
     def offset(self, offset_new):
         self._offset = offset_new
+        self._qidentity = not self._flip and offset_new == 0
+        self._notify()
+
+    @Link.flip.setter
+    def flip(self, flip_new):
+        self._flip = flip_new
+        # an int, so a symbolic joint variable becomes -q not -1.0*q
+        self._flip_sign = -1 if flip_new else 1
+        # the offset is not yet set when called from Link.__init__
+        self._qidentity = not flip_new \
+            and getattr(self, '_offset', 0) == 0
+        self._notify()
 
 # -------------------------------------------------------------------------- #
 
+    def _const_transform(self):
+        # the elements of the link transform that do not depend on the joint
+        # variable, the others are zero.  None if a parameter is symbolic
+        sa = self._sa
+        ca = self._ca
+        a = self._a
+
+        if _issymbol(sa) or _issymbol(a) or _issymbol(self._d) \
+                or _issymbol(self._st_fixed):
+            return None
+
+        T = np.zeros((4, 4))
+        T[3, 3] = 1
+
+        if self._mdh == 0:
+            T[2, 1] = sa
+            T[2, 2] = ca
+            if self._sigma == 0:
+                T[2, 3] = self._d
+            else:
+                st = self._st_fixed
+                ct = self._ct_fixed
+                T[0, 0] = ct
+                T[0, 1] = -st * ca
+                T[0, 2] = st * sa
+                T[0, 3] = a * ct
+                T[1, 0] = st
+                T[1, 1] = ct * ca
+                T[1, 2] = -ct * sa
+                T[1, 3] = a * st
+        else:
+            T[0, 3] = a
+            T[1, 2] = -sa
+            T[2, 2] = ca
+            if self._sigma == 0:
+                T[1, 3] = -sa * self._d
+                T[2, 3] = ca * self._d
+            else:
+                st = self._st_fixed
+                ct = self._ct_fixed
+                T[0, 0] = ct
+                T[0, 1] = -st
+                T[1, 0] = st * ca
+                T[1, 1] = ct * ca
+                T[2, 0] = st * sa
+                T[2, 1] = ct * sa
+
+        return T
+
     def A(self, q):
         r"""
         Link transform matrix
@@ -401,13 +687,53 @@ class DHLink(Link):
             :class:`RevoluteMDH`, :class:`PrismaticMDH`
         """
 
-        sa = _sin(self.alpha)
-        ca = _cos(self.alpha)
+        return SE3(self.A_ndarray(q), check=False)
 
-        if self.flip:
-            q = -q + self.offset
-        else:
-            q = q + self.offset
+    def A_ndarray(self, q, out=None):
+        """
+        Link transform matrix as an array
+
+        :param q: Joint coordinate
+        :type q: float
+        :param out: array to write the result into, optional
+        :type out: ndarray(4,4)
+        :return T: SE(3) link homogeneous transformation
+        :rtype T: ndarray(4,4)
+
+        As for :func:`A` but returns the matrix as an array rather than an
+        ``SE3`` instance, which avoids the overhead of the pose class when
+        the result is used directly in arithmetic, eg. chained with ``@``.
+
+        If ``out`` is given the result is written into it, and it is
+        returned, rather than allocating a new array.  This allows a
+        caller, such as a long running simulation, to reuse its own buffers.
+        It is ignored if the link parameters or ``q`` are symbolic.
+
+        :seealso: :func:`A`
+        """
+
+        # skip the arithmetic for the common case of no flip or offset
+        if not self._qidentity:
+            q = self._flip_sign * q + self._offset
+
+        Tc = self._T_const
+        if Tc is None:
+            Tc = self._T_const = self._const_transform()
+            self._A_fn = _A_fill[self._sigma, self._mdh]
+
+        if Tc is not None and not _issymbol(q):
+            # numeric, only the joint dependent elements are computed
+            if out is None:
+                T = Tc.copy()
+            else:
+                T = out
+                T[...] = Tc
+            self._A_fn(self, q, T)
+
+            return T
+
+        sa = self._sa
+        ca = self._ca
 
         if self.sigma == 0:
             # revolute
@@ -416,8 +742,8 @@ class DHLink(Link):
             d = self.d
         else:
             # prismatic
-            st = _sin(self.theta)
-            ct = _cos(self.theta)
+            st = self._st_fixed
+            ct = self._ct_fixed
             d = q
 
         if self.mdh == 0:
@@ -437,7 +763,72 @@ class DHLink(Link):
                 [0, 0, 0, 1]
             ])
 
-        return SE3(T, check=False)
+        return T
+
+    def A_batch(self, q):
+        """
+        Link transform matrices for many joint coordinates
+
+        :param q: Joint coordinates
+        :type q: array_like(m)
+        :return: link homogeneous transformations
+        :rtype: ndarray(m,4,4)
+
+        ``A_batch(q)`` is the transform computed by :func:`A` for every
+        element of ``q``, computed with vectorized NumPy operations rather
+        than one call per element.  As for :func:`A_ndarray` only the
+        elements that depend on the joint variable are computed, the others
+        are copied.  The link parameters must be numeric.
+
+        :seealso: :func:`A`
+        """
+        q = getvector(q)
+
+        if not self._qidentity:
+            q = self._flip_sign * q + self._offset
+
+        Tc = self._T_const
+        if Tc is None:
+            Tc = self._T_const = self._const_transform()
+            self._A_fn = _A_fill[self._sigma, self._mdh]
+
+        # start from the constant elements, only the joint dependent ones
+        # are computed
+        T = np.empty((len(q), 4, 4))
+        T[:] = Tc
+        sa = self._sa
+        ca = self._ca
+
+        if self._sigma == 0:
+            # revolute
+            st = np.sin(q)
+            ct = np.cos(q)
+            if self._mdh == 0:
+                a = self._a
+                T[:, 0, 0] = ct
+                T[:, 0, 1] = -st * ca
+                T[:, 0, 2] = st * sa
+                T[:, 0, 3] = a * ct
+                T[:, 1, 0] = st
+                T[:, 1, 1] = ct * ca
+                T[:, 1, 2] = -ct * sa
+                T[:, 1, 3] = a * st
+            else:
+                T[:, 0, 0] = ct
+                T[:, 0, 1] = -st
+                T[:, 1, 0] = st * ca
+                T[:, 1, 1] = ct * ca
+                T[:, 2, 0] = st * sa
+                T[:, 2, 1] = ct * sa
+        else:
+            # prismatic
+            if self._mdh == 0:
+                T[:, 2, 3] = q
+            else:
+                T[:, 1, 3] = -sa * q
+                T[:, 2, 3] = ca * q
+
+        return T
 
     @property
     def isrevolute(self):
@@ -572,6 +963,8 @@ class RevoluteDH(DHLink):
     :seealso: :func:`PrismaticDH`, :func:`DHLink`, :func:`RevoluteMDH`
     """  # noqa
 
+    __slots__ = ()
+
     def __init__(
             self,
             d=0.0,
@@ -580,6 +973,13 @@ class RevoluteDH(DHLink):
             offset=0.0,
             qlim=None,
             flip=False,
+            m=None,
+            r=None,
+            I=None,  # noqa
+            Jm=None,
+            B=None,
+            Tc=None,
+            G=None,
             **kwargs
             ):
 
@@ -589,7 +989,8 @@ class RevoluteDH(DHLink):
 
         super().__init__(
             d=d, alpha=alpha, theta=theta, a=a, sigma=sigma, mdh=mdh,
-            offset=offset, qlim=qlim, flip=flip, **kwargs)
+            offset=offset, qlim=qlim, flip=flip,
+            m=m, r=r, I=I, Jm=Jm, B=B, Tc=Tc, G=G, **kwargs)
 
 
 class PrismaticDH(DHLink):
@@ -643,6 +1044,8 @@ class PrismaticDH(DHLink):
     :seealso: :func:`RevoluteDH`, :func:`DHLink`, :func:`PrismaticMDH`
     """  # noqa
 
+    __slots__ = ()
+
     def __init__(
             self,
             theta=0.0,
@@ -651,6 +1054,13 @@ class PrismaticDH(DHLink):
             offset=0.0,
             qlim=None,
             flip=False,
+            m=None,
+            r=None,
+            I=None,  # noqa
+            Jm=None,
+            B=None,
+            Tc=None,
+            G=None,
             **kwargs
             ):
 
@@ -660,7 +1070,8 @@ class PrismaticDH(DHLink):
 
         super().__init__(
             theta=theta, d=d, a=a, alpha=alpha, sigma=sigma, mdh=mdh,
-            offset=offset, qlim=qlim, flip=flip, **kwargs)
+            offset=offset, qlim=qlim, flip=flip,
+            m=m, r=r, I=I, Jm=Jm, B=B, Tc=Tc, G=G, **kwargs)
 
 
 class RevoluteMDH(DHLink):
@@ -712,6 +1123,8 @@ class RevoluteMDH(DHLink):
     :seealso: :func:`PrismaticMDH`, :func:`DHLink`, :func:`RevoluteDH`
     """  # noqa
 
+    __slots__ = ()
+
     def __init__(
             self,
             d=0.0,
@@ -720,6 +1133,13 @@ class RevoluteMDH(DHLink):
             offset=0.0,
             qlim=None,
             flip=False,
+            m=None,
+            r=None,
+            I=None,  # noqa
+            Jm=None,
+            B=None,
+            Tc=None,
+            G=None,
             **kwargs
             ):
 
@@ -729,7 +1149,8 @@ class RevoluteMDH(DHLink):
 
         super().__init__(
             d=d, alpha=alpha, theta=theta, a=a, sigma=sigma, mdh=mdh,
-            offset=offset, qlim=qlim, flip=flip, **kwargs)
+            offset=offset, qlim=qlim, flip=flip,
+            m=m, r=r, I=I, Jm=Jm, B=B, Tc=Tc, G=G, **kwargs)
 
 
 class PrismaticMDH(DHLink):
@@ -783,6 +1204,8 @@ class PrismaticMDH(DHLink):
     :seealso: :func:`RevoluteMDH`, :func:`DHLink`, :func:`PrismaticDH`
     """  # noqa
 
+    __slots__ = ()
+
     def __init__(
             self,
             theta=0.0,
@@ -791,6 +1214,13 @@ class PrismaticMDH(DHLink):
             offset=0.0,
             qlim=None,
             flip=False,
+            m=None,
+            r=None,
+            I=None,  # noqa
+            Jm=None,
+            B=None,
+            Tc=None,
+            G=None,
             **kwargs
             ):
 
@@ -800,4 +1230,5 @@ class PrismaticMDH(DHLink):
 
         super().__init__(
             theta=theta, d=d, a=a, alpha=alpha, sigma=sigma, mdh=mdh,
-            offset=offset, qlim=qlim, flip=flip, **kwargs)
+            offset=offset, qlim=qlim, flip=flip,
+            m=m, r=r, I=I, Jm=Jm, B=B, Tc=Tc, G=G, **kwargs)
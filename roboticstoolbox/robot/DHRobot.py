@@ -23,8 +23,138 @@ from scipy.linalg import block_diag
 from roboticstoolbox.robot.DHLink import _check_rne
 from frne import init, frne, delete
 
+try:  # pragma: no cover
+    import numba
+    _numba = True
+except ImportError:  # pragma: no cover
+    _numba = False
+
 iksol = namedtuple("IKsolution", "q, success, reason")
 
+# dynamic parameters of all links, one row per link
+dynparams = namedtuple("DynamicParameters", "m, r, I, Jm, B, Tc, G")
+
+# packed inertia (Ixx, Iyy, Izz, Ixy, Iyz, Ixz) to and from the 3x3 matrix
+_I_pack = ([0, 1, 2, 0, 1, 0], [0, 1, 2, 1, 2, 2])
+_I_unpack = [0, 3, 5, 3, 1, 4, 5, 4, 2]
+
+if _numba:  # pragma: no cover
+
+    @numba.njit(cache=True)
+    def _fkine_fused(P, q, mdh, T):
+        # the whole DH chain in one call.  Each row of P is the parameters
+        # a, alpha, theta, d, sigma, offset, flip of a link.  Each link
+        # transform is formed in A and multiplied into the running product T
+        # in place, only the top 3 rows of the product are computed.
+        A = np.zeros((4, 4))
+        A[3, 3] = 1.0
+        row = np.empty(4)
+
+        for i in range(4):
+            for j in range(4):
+                T[i, j] = 1.0 if i == j else 0.0
+
+        for k in range(P.shape[0]):
+            a = P[k, 0]
+            theta = P[k, 2]
+            d = P[k, 3]
+
+            qk = (1.0 - 2.0 * P[k, 6]) * q[k] + P[k, 5]
+            if P[k, 4] == 0:
+                theta = qk
+            else:
+                d = qk
+
+            ca = np.cos(P[k, 1])
+            sa = np.sin(P[k, 1])
+            ct = np.cos(theta)
+            st = np.sin(theta)
+
+            if mdh == 0:
+                A[0, 0] = ct
+                A[0, 1] = -st * ca
+                A[0, 2] = st * sa
+                A[0, 3] = a * ct
+                A[1, 0] = st
+                A[1, 1] = ct * ca
+                A[1, 2] = -ct * sa
+                A[1, 3] = a * st
+                A[2, 0] = 0.0
+                A[2, 1] = sa
+                A[2, 2] = ca
+                A[2, 3] = d
+            else:
+                A[0, 0] = ct
+                A[0, 1] = -st
+                A[0, 2] = 0.0
+                A[0, 3] = a
+                A[1, 0] = st * ca
+                A[1, 1] = ct * ca
+                A[1, 2] = -sa
+                A[1, 3] = -sa * d
+                A[2, 0] = st * sa
+                A[2, 1] = ct * sa
+                A[2, 2] = ca
+                A[2, 3] = ca * d
+
+            for i in range(3):
+                for j in range(4):
+                    row[j] = T[i, 0] * A[0, j] + T[i, 1] * A[1, j] \
+                        + T[i, 2] * A[2, j]
+                row[3] += T[i, 3]
+                for j in range(4):
+                    T[i, j] = row[j]
+
+
+def _fkine_xp(xp, Q, P, mdh, frames=False):
+    # forward kinematics of a batch of configurations written only with
+    # operations common to NumPy, PyTorch and jax.numpy, so the same code
+    # runs on any of them, including on a GPU.  Q is (m,n) joint
+    # coordinates and P is (n,7) link parameters a, alpha, theta, d, sigma,
+    # offset, flip, both arrays of module xp.  Returns (m,4,4) or, if frames
+    # is True, the (m,n,4,4) frames of every link.
+    a, alpha, theta, d, sigma, offset, flip = [P[:, k] for k in range(7)]
+
+    # joint coordinate replaces theta or d, (m,n)
+    q = Q * (1 - 2 * flip) + offset
+    theta = (1 - sigma) * q + sigma * theta
+    d = sigma * q + (1 - sigma) * d
+
+    st = xp.sin(theta)
+    ct = xp.cos(theta)
+    zero = 0 * theta
+    one = zero + 1
+    sa = xp.sin(alpha) + zero
+    ca = xp.cos(alpha) + zero
+    a = a + zero
+
+    if mdh == 0:
+        elements = [
+            ct, -st * ca, st * sa, a * ct,
+            st, ct * ca, -ct * sa, a * st,
+            zero, sa, ca, d,
+            zero, zero, zero, one]
+    else:
+        elements = [
+            ct, -st, zero, a,
+            st * ca, ct * ca, -sa, -sa * d,
+            st * sa, ct * sa, ca, ca * d,
+            zero, zero, zero, one]
+    m, n = theta.shape
+    A = xp.stack(elements, -1).reshape(m, n, 4, 4)
+
+    # chain the link transforms, batched over the configurations
+    T = A[:, 0]
+    chain = [T]
+    for j in range(1, n):
+        T = T @ A[:, j]
+        chain.append(T)
+
+    if frames:
+        return xp.stack(chain, 1)
+    else:
+        return T
+
 
 class DHRobot(Robot):
     """
@@ -119,6 +249,9 @@ class DHRobot(Robot):
 
         # rne parameters
         self._rne_ob = None
+        self._dynparams = None
+        self._dhparams = None
+        self._fkcache = None
 
     def __str__(self):
         """
@@ -610,10 +743,10 @@ class DHRobot(Robot):
 
         :param q: The joint configuration of the robot (Optional,
             if not supplied will use the stored q values)
-        :type q: ndarray(n
+        :type q: ndarray(n) or ndarray(m,n)
         :return v: is a vector of boolean values, one per joint, False if
             ``q[j]`` is within the joint limits, else True
-        :rtype v: bool list
+        :rtype v: bool list or ndarray(m,n) of bool
 
         - ``robot.islimit(q)`` is a list of boolean values indicating if the
           joint configuration ``q`` is in violation of the joint limits.
@@ -621,6 +754,10 @@ class DHRobot(Robot):
         - ``robot.jointlimit()`` as above except uses the stored q value of the
           robot object.
 
+        If ``q`` is a 2D array, the rows are interpreted as a trajectory and
+        the result is an array with the same shape as ``q``.  Each joint
+        column is tested in one vectorized comparison.
+
         Example:
 
         .. runblock:: pycon
@@ -630,6 +767,11 @@ class DHRobot(Robot):
             >>> robot.islimit([0, 0, -4, 4, 0, 0])
 
         """
+        if q is not None and np.ndim(q) == 2:
+            q = getmatrix(q, (None, self.n))
+            return np.column_stack(
+                [link.islimit(q[:, j]) for j, link in enumerate(self)])
+
         q = self._getq(q)
 
         return [link.islimit(qk) for (link, qk) in zip(self, q)]
@@ -834,22 +976,332 @@ class DHRobot(Robot):
         T = SE3.Empty()
         for qr in getmatrix(q, (None, self.n)):
 
+            # chain the link transforms as arrays, only the result is SE3
             first = True
             for q, L in zip(qr, self.links):
                 if first:
-                    Tr = L.A(q)
+                    Tr = L.A_ndarray(q)
                     first = False
                 else:
-                    Tr *= L.A(q)
+                    Tr = Tr @ L.A_ndarray(q)
 
             if self._base is not None:
-                Tr = self._base * Tr
+                Tr = self._base.A @ Tr
             if self._tool is not None:
-                Tr = Tr * self._tool
-            T.append(Tr)
+                Tr = Tr @ self._tool.A
+            T.append(SE3(Tr, check=False))
 
         return T
 
+    def fkine_batch(self, Q):
+        """
+        Forward kinematics for many configurations
+
+        :param Q: Joint coordinates, one configuration per row
+        :type Q: ndarray(m,n)
+        :return: Pose of the end-effector for each configuration
+        :rtype: ndarray(m,4,4)
+
+        As for :func:`fkine` but returns a plain array rather than an ``SE3``
+        instance.  The link transforms are computed for all configurations
+        at once by :func:`DHLink.A_batch` and chained with batched matrix
+        multiplication, so the Python overhead is per link rather than per
+        link and configuration.  The robot's base and tool transforms, if
+        present, are included.
+
+        Example:
+
+        .. runblock:: pycon
+
+            >>> import roboticstoolbox as rtb
+            >>> puma = rtb.models.DH.Puma560()
+            >>> qt = rtb.jtraj(puma.qz, puma.qr, 50)
+            >>> T = puma.fkine_batch(qt.q)
+            >>> T.shape
+
+        :seealso: :func:`fkine`, :func:`DHLink.A_batch`
+        """
+        Q = getmatrix(Q, (None, self.n))
+
+        T = None
+        for j, L in enumerate(self.links):
+            A = L.A_batch(Q[:, j])
+            T = A if T is None else T @ A
+
+        if self._base is not None:
+            T = self._base.A @ T
+        if self._tool is not None:
+            T = T @ self._tool.A
+
+        return T
+
+    def fkine_fused(self, q):
+        """
+        Forward kinematics in a single compiled loop
+
+        :param q: The joint configuration
+        :type q: ndarray(n)
+        :return: Forward kinematics as an SE(3) matrix
+        :rtype: ndarray(4,4)
+
+        As for :func:`fkine` for a single configuration, but returns a plain
+        array.  The DH parameters of all the links are packed into one array
+        and the chain is evaluated by one Numba kernel, which forms each link
+        transform and multiplies it into a running product in place.  There
+        is one Python call for the whole chain rather than one per link, and
+        no intermediate arrays.  The robot's base and tool transforms, if
+        present, are included.
+
+        If Numba is not installed, or the parameters are symbolic, this falls
+        back to chaining :func:`DHLink.A_ndarray`.
+
+        Example:
+
+        .. runblock:: pycon
+
+            >>> import roboticstoolbox as rtb
+            >>> puma = rtb.models.DH.Puma560()
+            >>> puma.fkine_fused(puma.qr)
+
+        :seealso: :func:`fkine`, :func:`fkine_batch`
+        """
+        q = getvector(q, self.n)
+
+        P = None
+        if _numba and q.dtype.kind != 'O':
+            P = self._dh_params()
+
+        if P is not None:
+            T = np.empty((4, 4))
+            _fkine_fused(P, q.astype(np.float64), self._mdh, T)
+        else:
+            T = self.links[0].A_ndarray(q[0])
+            for qj, L in zip(q[1:], self.links[1:]):
+                T = T @ L.A_ndarray(qj)
+
+        if self._base is not None:
+            T = self._base.A @ T
+        if self._tool is not None:
+            T = T @ self._tool.A
+
+        return T
+
+    def fkine_incremental(self, q):
+        """
+        Forward kinematics reusing the previous configuration
+
+        :param q: The joint configuration
+        :type q: ndarray(n)
+        :return: Forward kinematics as an SE(3) matrix
+        :rtype: ndarray(4,4)
+
+        As for :func:`fkine` for a single configuration, but returns a plain
+        array.  The frames of all links for the previous call are kept, and
+        only those from the first joint whose coordinate has changed onward
+        are recomputed.  This suits callers that change one joint at a time,
+        such as a numerical Jacobian or coordinate descent, where changing
+        the last joint costs one link transform rather than ``n``.  The
+        kept frames are discarded when a link parameter changes.  The
+        robot's base and tool transforms, if present, are included.
+
+        Example:
+
+        .. runblock:: pycon
+
+            >>> import roboticstoolbox as rtb
+            >>> puma = rtb.models.DH.Puma560()
+            >>> puma.fkine_incremental(puma.qr)
+
+        :seealso: :func:`fkine`, :func:`fkine_fused`
+        """
+        q = getvector(q, self.n)
+
+        if q.dtype.kind == 'O' or self._dh_params() is None:
+            # symbolic, nothing to reuse
+            T = self.links[0].A_ndarray(q[0])
+            for qj, L in zip(q[1:], self.links[1:]):
+                T = T @ L.A_ndarray(qj)
+        else:
+            if self._fkcache is None:
+                # NaN differs from every coordinate, so all are computed
+                self._fkcache = (
+                    np.full(self.n, np.nan), np.empty((self.n, 4, 4)))
+            qlast, F = self._fkcache
+
+            changed = np.flatnonzero(q != qlast)
+            if len(changed) > 0:
+                k = changed[0]
+                # if a link transform fails the cache is left invalid
+                qlast[k:] = np.nan
+                for j in range(k, self.n):
+                    L = self.links[j]
+                    if j == 0:
+                        L.A_ndarray(q[0], out=F[0])
+                    else:
+                        np.matmul(F[j - 1], L.A_ndarray(q[j]), out=F[j])
+                qlast[k:] = q[k:]
+            T = F[-1].copy()
+
+        if self._base is not None:
+            T = self._base.A @ T
+        if self._tool is not None:
+            T = T @ self._tool.A
+
+        return T
+
+    def _dh_params(self):
+        # the kinematic parameters of all links as an (n,7) array, see
+        # DHLink.pack_chain.  Cached until a link parameter changes, which
+        # calls dynchanged().  None if any parameter is symbolic
+        P = self._dhparams
+        if P is None:
+            P = self._dhparams = DHLink.pack_chain(self.links)
+        return P
+
+    def fkine_torch(self, Q, frames=False, device=None, dtype=None):
+        """
+        Forward kinematics for a batch of configurations with PyTorch
+
+        :param Q: Joint coordinates, one configuration per row
+        :type Q: torch.Tensor(m,n) or ndarray(m,n)
+        :param frames: return the frames of all links
+        :type frames: bool
+        :param device: device for the computation, defaults to that of ``Q``
+        :type device: str or torch.device
+        :param dtype: floating point type, defaults to that of ``Q``
+        :type dtype: torch.dtype
+        :return: Pose of the end-effector for each configuration
+        :rtype: torch.Tensor(m,4,4)
+
+        The link transforms for all configurations are built with broadcast
+        tensor operations and chained with batched ``torch.matmul``, so the
+        computation can run on a GPU and is differentiable with respect to
+        ``Q``.  With ``frames=True`` the result is a tensor(m,n,4,4) with the
+        frame of every link, the last of which is the end-effector, without
+        the tool transform.  The robot's base and tool transforms, if
+        present, are included.
+
+        Example::
+
+            >>> import torch
+            >>> puma = rtb.models.DH.Puma560()
+            >>> Q = torch.rand(1000, 6, device="cuda")
+            >>> T = puma.fkine_torch(Q)
+
+        :seealso: :func:`fkine_batch`, :func:`fkine_jax`
+        """
+        try:
+            import torch
+        except ImportError:  # pragma: no cover
+            raise ImportError(
+                "PyTorch is required for fkine_torch, "
+                "install using pip install torch")
+
+        Q = torch.as_tensor(Q, device=device, dtype=dtype)
+        if not Q.is_floating_point():
+            Q = Q.to(torch.get_default_dtype())
+        Q = Q.reshape(-1, self.n)
+
+        P = self._dh_params()
+        if P is None:
+            raise ValueError("link parameters must be numeric")
+        P = torch.as_tensor(P, device=Q.device, dtype=Q.dtype)
+
+        T = _fkine_xp(torch, Q, P, self._mdh, frames=frames)
+
+        if self._base is not None:
+            T = torch.as_tensor(
+                self._base.A, device=Q.device, dtype=Q.dtype) @ T
+        if self._tool is not None and not frames:
+            T = T @ torch.as_tensor(
+                self._tool.A, device=Q.device, dtype=Q.dtype)
+        return T
+
+    def fkine_jax(self, Q, frames=False):
+        """
+        Forward kinematics for a batch of configurations with JAX
+
+        :param Q: Joint coordinates, one configuration per row
+        :type Q: jax.Array(m,n) or ndarray(m,n)
+        :param frames: return the frames of all links
+        :type frames: bool
+        :return: Pose of the end-effector for each configuration
+        :rtype: jax.Array(m,4,4)
+
+        As for :func:`fkine_torch` but with ``jax.numpy``, so the result can
+        be used with ``jax.jit``, ``jax.grad`` and ``jax.vmap``.
+
+        Example::
+
+            >>> import jax.numpy as jnp
+            >>> puma = rtb.models.DH.Puma560()
+            >>> T = puma.fkine_jax(jnp.zeros((1000, 6)))
+
+        :seealso: :func:`fkine_batch`, :func:`fkine_torch`
+        """
+        try:
+            import jax.numpy as jnp
+        except ImportError:  # pragma: no cover
+            raise ImportError(
+                "JAX is required for fkine_jax, install using pip install jax")
+
+        Q = jnp.asarray(Q)
+        if not jnp.issubdtype(Q.dtype, jnp.floating):
+            Q = Q.astype(jnp.float32)
+        Q = Q.reshape(-1, self.n)
+
+        P = self._dh_params()
+        if P is None:
+            raise ValueError("link parameters must be numeric")
+        P = jnp.asarray(P, dtype=Q.dtype)
+
+        T = _fkine_xp(jnp, Q, P, self._mdh, frames=frames)
+
+        if self._base is not None:
+            T = jnp.asarray(self._base.A, dtype=Q.dtype) @ T
+        if self._tool is not None and not frames:
+            T = T @ jnp.asarray(self._tool.A, dtype=Q.dtype)
+        return T
+
+    def codegen(self, compiled=True, cachedir=None):
+        """
+        Generate specialized forward kinematics for this robot
+
+        :param compiled: compile the generated code with Cython if available
+        :type compiled: bool
+        :param cachedir: directory for generated modules, defaults to
+            ``~/.cache/rtb``
+        :type cachedir: str or Path
+        :return: forward kinematics module
+        :rtype: module
+
+        The link transforms are multiplied out symbolically with the DH
+        parameters, joint offsets, and base and tool transforms as numeric
+        literals, and emitted as straight-line code with common
+        subexpressions factored out.  The module has a function
+        ``fkine(q0, ..., qn)`` which returns the same pose as :func:`fkine`
+        as an ndarray(4,4).
+
+        The module is cached in ``cachedir`` by a hash of its source, so it
+        is only compiled once for each distinct robot.  It does not follow
+        later changes to the robot's parameters, call ``codegen`` again.
+
+        Example:
+
+        .. runblock:: pycon
+
+            >>> import roboticstoolbox as rtb
+            >>> puma = rtb.models.DH.Puma560()
+            >>> fk = puma.codegen()
+            >>> fk.fkine(*puma.qr)
+
+        :seealso: :func:`fkine`,
+            :func:`~roboticstoolbox.tools.codegen.fkine_compile`
+        """
+        from roboticstoolbox.tools.codegen import fkine_compile
+
+        return fkine_compile(self, compiled=compiled, cachedir=cachedir)
+
     def fkine_path(self, q, old=None):
         '''
         Compute the pose of every link frame
@@ -976,7 +1428,7 @@ class DHRobot(Robot):
         for j in range(n - 1, -1, -1):
             if self.mdh == 0:
                 # standard DH convention
-                U = L[j].A(q[j]).A @ U
+                U = L[j].A_ndarray(q[j]) @ U
 
             if not L[j].sigma:
                 # revolute axis
@@ -995,7 +1447,7 @@ class DHRobot(Robot):
 
             if self.mdh != 0:
                 # modified DH convention
-                U = L[j].A(q[j]).A @ U
+                U = L[j].A_ndarray(q[j]) @ U
 
         # return top or bottom half if asked
         if half is not None:
@@ -1165,28 +1617,94 @@ class DHRobot(Robot):
 # -------------------------------------------------------------------------- #
 
     def _init_rne(self):
-        # Compress link data into a 1D array
-        L = np.zeros(24 * self.n)
+        # Compress link data into a 1D array, filled a column at a time as
+        # a (n,24) array
+        L = np.zeros((self.n, 24))
 
-        for i in range(self.n):
-            j = i * 24
-            L[j] = self.links[i].alpha
-            L[j + 1] = self.links[i].a
-            L[j + 2] = self.links[i].theta
-            L[j + 3] = self.links[i].d
-            L[j + 4] = self.links[i].sigma
-            L[j + 5] = self.links[i].offset
-            L[j + 6] = self.links[i].m
-            L[j + 7:j + 10] = self.links[i].r.flatten()
-            L[j + 10:j + 19] = self.links[i].I.flatten()
-            L[j + 19] = self.links[i].Jm
-            L[j + 20] = self.links[i].G
-            L[j + 21] = self.links[i].B
-            L[j + 22:j + 24] = self.links[i].Tc.flatten()
+        for i, link in enumerate(self.links):
+            L[i, :6] = [
+                link.alpha, link.a, link.theta, link.d, link.sigma,
+                link.offset]
+
+        D = self.dyn_arrays()
+        L[:, 6] = D.m
+        L[:, 7:10] = D.r
+        L[:, 10:19] = D.I[:, _I_unpack]
+        L[:, 19] = D.Jm
+        L[:, 20] = D.G
+        L[:, 21] = D.B
+        L[:, 22:24] = D.Tc
+        L = L.flatten()
 
         # we negate gravity here, since the C code has the sign wrong
         self._rne_ob = init(self.n, self.mdh, L, -self.gravity)
 
+    def dynchanged(self, what=None):
+        """
+        Dynamic parameters have changed (DHRobot)
+
+        As for :func:`Robot.dynchanged` and also invalidates the arrays
+        returned by :func:`dyn_arrays`, the packed kinematic parameters and
+        the frames kept by :func:`fkine_incremental`.
+        """
+        super().dynchanged(what)
+        if what != 'gravity':
+            self._dynparams = None
+            self._dhparams = None
+            self._fkcache = None
+
+    def dyn_arrays(self):
+        """
+        Dynamic parameters of all links as arrays
+
+        :return: dynamic parameters, one row per link
+        :rtype: namedtuple
+
+        The parameters of all links are gathered into one array per
+        parameter, a structure of arrays rather than one object per link,
+        so computations over all links can be vectorized.  The named tuple
+        has elements:
+
+        ======  =============  =========================================
+        name    shape          parameter
+        ======  =============  =========================================
+        ``m``   ndarray(n)     link mass
+        ``r``   ndarray(n,3)   centre of mass
+        ``I``   ndarray(n,6)   inertia (Ixx, Iyy, Izz, Ixy, Iyz, Ixz)
+        ``Jm``  ndarray(n)     motor inertia
+        ``B``   ndarray(n)     motor viscous friction
+        ``Tc``  ndarray(n,2)   motor Coulomb friction
+        ``G``   ndarray(n)     gear ratio
+        ======  =============  =========================================
+
+        The inertia is packed since it is symmetric.  The arrays are cached
+        and rebuilt after any dynamic parameter of a link changes, they
+        should not be modified.
+
+        Example:
+
+        .. runblock:: pycon
+
+            >>> import roboticstoolbox as rtb
+            >>> puma = rtb.models.DH.Puma560()
+            >>> puma.dyn_arrays().m
+
+        :seealso: :func:`dynchanged`
+        """
+        D = self._dynparams
+        if D is None:
+            links = self.links
+            I = np.array([link.I for link in links])  # noqa
+            D = self._dynparams = dynparams(
+                m=np.array([link.m for link in links]),
+                r=np.array([link.r for link in links]),
+                I=I[:, _I_pack[0], _I_pack[1]],
+                Jm=np.array([link.Jm for link in links]),
+                B=np.array([link.B for link in links]),
+                Tc=np.array([link.Tc for link in links]),
+                G=np.array([link.G for link in links]))
+        return D
+
     def delete_rne(self):
         """
         Frees the memory holding the robot object in c if the robot object
@@ -1403,11 +1921,11 @@ class DHRobot(Robot):
                 # compute the link rotation matrix
                 if link.sigma == 0:
                     # revolute axis
-                    Tj = link.A(q_k[j]).A
+                    Tj = link.A_ndarray(q_k[j])
                     d = link.d
                 else:
                     # prismatic
-                    Tj = link.A(link.theta).A
+                    Tj = link.A_ndarray(link.theta)
                     d = q_k[j]
 
                 # compute pstar:
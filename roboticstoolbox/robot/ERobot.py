@@ -4,7 +4,7 @@ Created on Tue Apr 24 15:48:52 2020
 @author: Jesse Haviland
 """
 
-from os.path import splitext
+from os.path import splitext, exists, isabs
 import copy
 import tempfile
 import subprocess
@@ -22,7 +22,7 @@ from roboticstoolbox.robot.Robot import Robot
 from roboticstoolbox.robot.Gripper import Gripper
 from roboticstoolbox.tools.data import path_to_datafile
 
-from pathlib import PurePosixPath
+from pathlib import Path, PurePosixPath
 from ansitable import ANSITable, Column
 from spatialmath import (
     SpatialAcceleration,
@@ -974,6 +974,13 @@ graph [rankdir=LR];
 
 
 class ERobot(BaseERobot):
+
+    # generated forward kinematics, a function of the n joint coordinates
+    # returning ndarray(4,4), see roboticstoolbox.tools.codegen.  It computes
+    # the chain from the base link to the link named _fk_specialized_end
+    _fk_specialized = None
+    _fk_specialized_end = None
+
     def __init__(self, arg, **kwargs):
 
         if isinstance(arg, DHRobot):
@@ -1190,32 +1197,58 @@ class ERobot(BaseERobot):
         :type tld: str, optional
         :return: Links and robot name
         :rtype: tuple(ELink list, str)
-        File should be specified relative to ``RTBDATA/URDF/xacro``
+        File should be specified relative to ``RTBDATA/URDF/xacro``, or as
+        an absolute path in which case the xacro folder is not searched.
         """
 
-        # get the path to the class that defines the robot
-        base_path = path_to_datafile("xacro")
-        # print("*** urdf_to_ets_args: ", classpath)
-        # add on relative path to get to the URDF or xacro file
-        # base_path = PurePath(classpath).parent.parent / 'URDF' / 'xacro'
-        file_path = base_path / PurePosixPath(file_path)
+        if isabs(file_path) and exists(file_path):
+            # native absolute path, eg. C:\... on Windows
+            base_path = None
+            file_path = Path(file_path)
+        else:
+            # get the path to the class that defines the robot
+            base_path = path_to_datafile("xacro")
+            # print("*** urdf_to_ets_args: ", classpath)
+            # add on relative path to get to the URDF or xacro file
+            # base_path = PurePath(classpath).parent.parent / 'URDF' / 'xacro'
+            file_path = base_path / PurePosixPath(file_path)
         name, ext = splitext(file_path)
 
         if ext == ".xacro":
             # it's a xacro file, preprocess it
             if tld is not None:
+                if base_path is None:
+                    base_path = path_to_datafile("xacro")
                 tld = base_path / PurePosixPath(tld)
             urdf_string = xacro.main(file_path, tld)
-            try:
-                urdf = URDF.loadstr(urdf_string, file_path)
-            except BaseException as e:
-                print("error parsing URDF file", file_path)
-                raise e
+            return ERobot.URDF_read_string(urdf_string, file_path)
         else:  # pragma nocover
             urdf = URDF.loadstr(open(file_path).read(), file_path)
 
         return urdf.elinks, urdf.name
 
+    @staticmethod
+    def URDF_read_string(urdf_string, file_path):
+        """
+        Read a URDF string as ELinks
+        :param urdf_string: URDF XML, already expanded by xacro
+        :type urdf_string: str
+        :param file_path: absolute path of the file the URDF came from
+        :type file_path: str or Path
+        :return: Links and robot name
+        :rtype: tuple(ELink list, str)
+        The string is handed directly to the XML parser, the xacro
+        preprocessor is not run.  ``file_path`` is used to resolve relative
+        paths within the URDF.
+        """
+        try:
+            urdf = URDF.loadstr(urdf_string, file_path)
+        except BaseException as e:
+            print("error parsing URDF file", file_path)
+            raise e
+
+        return urdf.elinks, urdf.name
+
     # --------------------------------------------------------------------- #
 
     def fkine(
@@ -1281,6 +1314,11 @@ class ERobot(BaseERobot):
         q = getmatrix(q, (None, self.n))
 
         end, start, etool = self._get_limit_links(end, start)
+        if q.dtype.kind == 'O':
+            # symbolic, the generated code only accepts numbers
+            fk_specialized = None
+        else:
+            fk_specialized = self._get_fk_specialized(end, start, etool)
 
         if etool is not None and tool is not None:
             tool = (etool * tool).A
@@ -1297,32 +1335,39 @@ class ERobot(BaseERobot):
         for k, qk in enumerate(q):
             if unit == "deg":
                 qk = self.toradians(qk)
-            link = end  # start with last link
 
-            # add tool if provided
-            A = link.A(qk[link.jindex], fast=True)
-            if A is None:
-                Tk = tool
+            if fk_specialized is not None:
+                # generated code for the whole chain
+                Tk = fk_specialized(*qk)
+                if tool is not None:
+                    Tk = Tk @ tool
             else:
-                if tool is None:
-                    Tk = A
-                elif A is not None:
-                    Tk = A @ tool
+                link = end  # start with last link
 
-            # add remaining links, back toward the base
-            while True:
-                link = link.parent
+                # add tool if provided
+                A = link.A(qk[link.jindex], fast=True)
+                if A is None:
+                    Tk = tool
+                else:
+                    if tool is None:
+                        Tk = A
+                    elif A is not None:
+                        Tk = A @ tool
 
-                if link is None:
-                    break
+                # add remaining links, back toward the base
+                while True:
+                    link = link.parent
 
-                A = link.A(qk[link.jindex], fast=True)
+                    if link is None:
+                        break
 
-                if A is not None:
-                    Tk = A @ Tk
+                    A = link.A(qk[link.jindex], fast=True)
 
-                if link is start:
-                    break
+                    if A is not None:
+                        Tk = A @ Tk
+
+                    if link is start:
+                        break
 
             # add base transform if it is set
             if self._base is not None and start == self.base_link:
@@ -1333,6 +1378,17 @@ class ERobot(BaseERobot):
 
         return T
 
+    def _get_fk_specialized(self, end, start, etool):
+        # the generated forward kinematics if it computes the chain from
+        # start to end, as resolved by _get_limit_links, otherwise None.  The
+        # end-effector may have been changed, or a gripper attached, since the
+        # code was generated
+        if self._fk_specialized is None or etool is not None \
+                or start is not self.base_link \
+                or end.name != self._fk_specialized_end:
+            return None
+        return self._fk_specialized
+
     def get_path(self, end=None, start=None, _fknm=False):
         """
         Find a path from start to end. The end must come after
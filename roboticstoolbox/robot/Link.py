@@ -1,43 +1,41 @@
-import copy
 from abc import ABC
+from functools import lru_cache
 import numpy as np
-from functools import wraps
-from spatialmath.base import getvector, isscalar, isvector, ismatrix
+from spatialmath.base import getvector, isscalar
 from ansitable import ANSITable, Column
 
 
-def _listen_dyn(func):
-    """
-    @_listen_dyn
-
-    Decorator for property setters
-
-    Use this decorator for any property setter that updates a parameter that
-    affects the result of inverse dynamics.  This allows the C version of the
-    parameters only having to be updated when they change, rather than on
-    every call.  This decorator signals the change by:
-    
-    - invoking the ``.dynchanged()`` method of the robot that owns the link.
-      This assumes that the Link object is owned by a robot, this happens
-      when the Link object is passed to a robot constructor.
-    - setting the ``._hasdynamics`` attribute of the Link
-
-    Example::
-
-        @m.setter
-        @_listen_dyn
-        def m(self, m_new):
-            self._m = m_new
-
-    :seealso: :func:`DHLink._dyn_changed`
-    """
-    @wraps(func)
-    def wrapper_listen_dyn(*args):
-        if args[0]._robot is not None:
-            args[0]._robot.dynchanged()
-        args[0]._hasdynamics = True
-        return func(*args)
-    return wrapper_listen_dyn
+def _issymmetric(I, tol=1e-8):  # noqa
+    # compare the off-diagonal elements of a 3x3 matrix as scalars, cheaper
+    # than forming I - I.T for such a small matrix
+    return abs(I[0, 1] - I[1, 0]) <= tol \
+        and abs(I[0, 2] - I[2, 0]) <= tol \
+        and abs(I[1, 2] - I[2, 1]) <= tol
+
+
+_unset = object()
+
+
+@lru_cache(maxsize=None)
+def _slots(cls):
+    # the slots of a class and its superclasses, as names for fast access by
+    # getattr, or as member descriptors where a subclass defines a property
+    # of the same name
+    names = []
+    shadowed = []
+    for c in cls.__mro__:
+        slots = c.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name in ('__dict__', '__weakref__'):
+                continue
+            slot = c.__dict__[name]
+            if getattr(cls, name) is slot:
+                names.append(name)
+            else:
+                shadowed.append(slot)
+    return tuple(names), tuple(shadowed)
 
 
 class Link(ABC):
@@ -90,6 +88,13 @@ class Link(ABC):
 
     """
 
+    # the attributes are fixed so instances need no __dict__, subclasses that
+    # do not declare __slots__ get one as usual
+    __slots__ = (
+        '_robot', '_name', '_flip', '_qlim',
+        'geometry', 'collision', 'mesh', 'actuator', '_hasdynamics',
+        '_m', '_r', '_I', '_Jm', '_B', '_Tc', '_G')
+
     def __init__(
             self,
             name=None,
@@ -103,8 +108,8 @@ class Link(ABC):
             Tc=None,
             G=None,
             mesh=None,
-            geometry=[],
-            collision=[],
+            geometry=None,
+            collision=None,
             **kwargs):
 
         self._robot = None  # reference to owning robot
@@ -115,9 +120,9 @@ class Link(ABC):
         self.flip = flip
         self.qlim = qlim
 
-        # Link geometry
-        self.geometry = geometry
-        self.collision = collision
+        # Link geometry, each link has its own lists
+        self.geometry = [] if geometry is None else geometry
+        self.collision = [] if collision is None else collision
 
         # TODO this is a leftover from VPython development, should be
         # using geometry instead
@@ -152,6 +157,34 @@ class Link(ABC):
 
         self._hasdynamics = dynchange > 0
 
+    def _notify(self):
+        """
+        Signal a change of a dynamic parameter
+
+        Call this at the end of any property setter that updates a parameter
+        that affects the result of inverse dynamics.  This allows the C
+        version of the parameters only having to be updated when they change,
+        rather than on every call.  It:
+
+        - invokes the ``.dynchanged()`` method of the robot that owns the
+          link, if any.  The Link object is owned by a robot when it is passed
+          to a robot constructor.
+        - sets the ``._hasdynamics`` attribute of the Link
+
+        Example::
+
+            @m.setter
+            def m(self, m_new):
+                self._m = m_new
+                self._notify()
+
+        :seealso: :func:`Robot.dynchanged`
+        """
+        self._hasdynamics = True
+        robot = self._robot
+        if robot is not None:
+            robot.dynchanged()
+
     def copy(self):
         """
         Copy of link object
@@ -162,10 +195,34 @@ class Link(ABC):
         ``link.copy()`` is a new Link subclass instance with a copy of all
         the parameters.
         """
-        new = copy.copy(self)
-        for k, v in self.__dict__.items():
-            if k.startswith('_') and isinstance(v, np.ndarray):
-                setattr(new, k, np.copy(v))
+        # bypass the constructor and the copy module's protocol dispatch, a
+        # link is plain instance data held in slots and possibly a __dict__
+        cls = self.__class__
+        new = cls.__new__(cls)
+        names, shadowed = _slots(cls)
+        for name in names:
+            v = getattr(self, name, _unset)
+            if v is _unset:
+                continue
+            if isinstance(v, np.ndarray):
+                v = v.copy()
+            setattr(new, name, v)
+        for slot in shadowed:
+            try:
+                v = slot.__get__(self)
+            except AttributeError:
+                continue
+            if isinstance(v, np.ndarray):
+                v = v.copy()
+            slot.__set__(new, v)
+
+        state = getattr(self, '__dict__', None)
+        if state is not None:
+            state = state.copy()
+            for k, v in state.items():
+                if k.startswith('_') and isinstance(v, np.ndarray):
+                    state[k] = v.copy()
+            new.__dict__.update(state)
         return new
 
     def _copy(self):
@@ -302,21 +359,29 @@ class Link(ABC):
         Checks if joint exceeds limit
 
         :param q: joint coordinate
-        :type q: float
+        :type q: float or ndarray(m)
         :return: True if joint is exceeded
-        :rtype: bool
+        :rtype: bool or ndarray(m) of bool
 
         ``link.islimit(q)`` is True if ``q`` exceeds the joint limits defined
-        by ``link``.
+        by ``link``.  If ``q`` is an array the result is an array of the same
+        shape, computed with a single comparison over all elements.
 
         .. note:: If no limits are set always return False.
 
         :seealso: :func:`qlim`
         """
-        if self.qlim is None:
-            return False
-        else:
-            return q < self.qlim[0] or q > self.qlim[1]
+        # the limits are read on each call, qlim may be modified in place
+        qlim = self._qlim
+        if np.ndim(q) == 0:
+            if qlim is None:
+                return False
+            return q < qlim[0] or q > qlim[1]
+
+        q = np.asarray(q)
+        if qlim is None:
+            return np.zeros(q.shape, dtype=bool)
+        return (q < qlim[0]) | (q > qlim[1])
 
     def nofriction(self, coulomb=True, viscous=False):
         """
@@ -352,14 +417,16 @@ class Link(ABC):
         Compute joint friction
 
         :param qd: The joint velocity
-        :type qd: float
+        :type qd: float or ndarray(m)
         :param coulomb: include Coulomb friction
         :type coloumb: bool, default True
         :return tau: the friction force/torque
-        :rtype tau: float
+        :rtype tau: float or ndarray(m)
 
         ``friction(qd)`` is the joint friction force/torque
-        for joint velocity ``qd``. The friction model includes:
+        for joint velocity ``qd``. If ``qd`` is an array, eg. the velocity
+        of this joint along a trajectory, the friction is computed for each
+        element.  The friction model includes:
 
         - Viscous friction which is a linear function of velocity.
         - Coulomb friction which is proportional to sign(qd).
@@ -391,16 +458,15 @@ class Link(ABC):
 
         """
 
-        tau = self.B * np.abs(self.G) * qd
+        G = np.abs(self.G)
+        tau = self.B * G * qd
 
         if coulomb:
-            if qd > 0:
-                tau += self.Tc[0]
-            elif qd < 0:
-                tau += self.Tc[1]
+            tau = tau + np.where(
+                qd > 0, self.Tc[0], np.where(qd < 0, self.Tc[1], 0.0))
 
         # Scale up by gear ratio
-        tau = -np.abs(self.G) * tau
+        tau = -G * tau
 
         return tau
 
@@ -450,6 +516,10 @@ class Link(ABC):
     def qlim(self, qlim_new):
         if qlim_new is None:
             self._qlim = None
+        elif isinstance(qlim_new, np.ndarray) and qlim_new.shape == (2,) \
+                and qlim_new.dtype == np.float64:
+            # fast path, already in the form getvector would return
+            self._qlim = qlim_new.copy()
         else:
             self._qlim = getvector(qlim_new, 2)
 
@@ -528,9 +598,9 @@ class Link(ABC):
         return self._m
 
     @m.setter
-    @_listen_dyn
     def m(self, m_new):
         self._m = m_new
+        self._notify()
 
 # -------------------------------------------------------------------------- #
 
@@ -552,9 +622,14 @@ class Link(ABC):
         return self._r
 
     @r.setter
-    @_listen_dyn
     def r(self, r_new):
-        self._r = getvector(r_new, 3)
+        if isinstance(r_new, np.ndarray) and r_new.shape == (3,) \
+                and r_new.dtype == np.float64:
+            # fast path, already in the form getvector would return
+            self._r = r_new.copy()
+        else:
+            self._r = getvector(r_new, 3)
+        self._notify()
 
 # -------------------------------------------------------------------------- #
 
@@ -590,30 +665,33 @@ class Link(ABC):
         return self._I
 
     @I.setter
-    @_listen_dyn
     def I(self, I_new):  # noqa
 
-        if ismatrix(I_new, (3, 3)):
+        # one conversion, then dispatch on the shape
+        I_new = np.asarray(I_new)
+        shape = I_new.shape
+        if len(shape) == 2 and shape != (3, 3) and 1 in shape:
+            # row or column vector
+            I_new = I_new.reshape(-1)
+            shape = I_new.shape
+
+        if shape == (3, 3):
             # 3x3 matrix passed
-            if np.any(np.abs(I_new - I_new.T) > 1e-8):
+            if not _issymmetric(I_new):
                 raise ValueError('3x3 matrix is not symmetric')
 
-        elif isvector(I_new, 9):
+        elif shape == (9,):
             # 3x3 matrix passed as a 1d vector
             I_new = I_new.reshape(3, 3)
-            if np.any(np.abs(I_new - I_new.T) > 1e-8):
+            if not _issymmetric(I_new):
                 raise ValueError('3x3 matrix is not symmetric')
 
-        elif isvector(I_new, 6):
+        elif shape == (6,):
             # 6-vector passed, moments and products of inertia,
             # [Ixx Iyy Izz Ixy Iyz Ixz]
-            I_new = np.array([
-                [I_new[0], I_new[3], I_new[5]],
-                [I_new[3], I_new[1], I_new[4]],
-                [I_new[5], I_new[4], I_new[2]]
-            ])
+            I_new = I_new[[0, 3, 5, 3, 1, 4, 5, 4, 2]].reshape(3, 3)
 
-        elif isvector(I_new, 3):
+        elif shape == (3,):
             # 3-vector passed, moments of inertia [Ixx Iyy Izz]
             I_new = np.diag(I_new)
 
@@ -621,6 +699,7 @@ class Link(ABC):
             raise ValueError('invalid shape passed: must be (3,3), (6,), (3,)')
 
         self._I = I_new
+        self._notify()
 
 # -------------------------------------------------------------------------- #
 
@@ -641,9 +720,9 @@ class Link(ABC):
         return self._Jm
 
     @Jm.setter
-    @_listen_dyn
     def Jm(self, Jm_new):
         self._Jm = Jm_new
+        self._notify()
 
 # -------------------------------------------------------------------------- #
 
@@ -666,12 +745,12 @@ class Link(ABC):
         return self._B
 
     @B.setter
-    @_listen_dyn
     def B(self, B_new):
         if isscalar(B_new):
             self._B = B_new
         else:
             raise TypeError("B must be a scalar")
+        self._notify()
 
 # -------------------------------------------------------------------------- #
 
@@ -706,15 +785,20 @@ class Link(ABC):
         return self._Tc
 
     @Tc.setter
-    @_listen_dyn
     def Tc(self, Tc_new):
 
-        try:
+        # dispatch on the size of the argument rather than trying one form
+        # and catching the exception
+        if isinstance(Tc_new, np.ndarray) and Tc_new.shape == (2,) \
+                and Tc_new.dtype == np.float64:
+            # fast path, already in the form getvector would return
+            Tc_new = Tc_new.copy()
+        elif np.size(Tc_new) == 1:
             # sets Coulomb friction parameters to [F -F], for a symmetric
             # Coulomb friction model.
             Tc = getvector(Tc_new, 1)
             Tc_new = np.array([Tc[0], -Tc[0]])
-        except ValueError:
+        else:
             # [FP FM] sets Coulomb friction to [FP FM], for an asymmetric
             # Coulomb friction model. FP>0 and FM<0.  FP is applied for a
             # positive joint velocity and FM for a negative joint
@@ -722,6 +806,7 @@ class Link(ABC):
             Tc_new = getvector(Tc_new, 2)
 
         self._Tc = Tc_new
+        self._notify()
 
 # -------------------------------------------------------------------------- #
 
@@ -746,9 +831,9 @@ class Link(ABC):
         return self._G
 
     @G.setter
-    @_listen_dyn
     def G(self, G_new):
         self._G = G_new
+        self._notify()
 
 # -------------------------------------------------------------------------- #
 
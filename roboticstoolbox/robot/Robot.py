@@ -107,6 +107,7 @@ class Robot(ABC, DynamicsMixin, IKMixin):
         self.control_type = 'v'
 
         self._configdict = {}
+        self._configalias = {}
 
         self._dynchanged = False
 
@@ -187,7 +188,7 @@ class Robot(ABC, DynamicsMixin, IKMixin):
         Called from a property setter to inform the robot that the cache of
         dynamic parameters is invalid.
 
-        :seealso: :func:`roboticstoolbox.Link._listen_dyn`
+        :seealso: :func:`roboticstoolbox.Link._notify`
         """
         self._dynchanged = True
         if what != 'gravity':
@@ -376,8 +377,51 @@ class Robot(ABC, DynamicsMixin, IKMixin):
         """
         v = getvector(q, self.n)
         v = getunit(v, unit)
+
+        # a redefined alias becomes a configuration in its own right
+        self._configalias.pop(name, None)
+
         self._configdict[name] = v
         setattr(self, name, v)
+        self._update_aliases(name)
+
+    def add_configuration_alias(self, name, existing):
+        """
+        Add an alternative name for a joint configuration (Robot superclass)
+
+        :param name: New name of the joint configuration
+        :type name: str
+        :param existing: Name of an existing joint configuration
+        :type existing: str
+        :raises ValueError: ``existing`` is not a named configuration
+
+        The alias refers to the same array as the existing configuration,
+        and follows it if that configuration is later redefined.
+
+        Example:
+
+        .. runblock:: pycon
+
+            >>> import roboticstoolbox as rtb
+            >>> robot = rtb.models.DH.Puma560()
+            >>> robot.add_configuration_alias("home", "qz")
+            >>> robot.home is robot.qz
+        """
+        if existing not in self._configdict:
+            raise ValueError(f"no configuration named {existing}")
+
+        # an alias of an alias refers to the original
+        existing = self._configalias.get(existing, existing)
+
+        self._configalias[name] = existing
+        self._update_aliases(existing)
+
+    def _update_aliases(self, name):
+        # point the aliases of configuration name at its current value
+        for alias, target in self._configalias.items():
+            if target == name:
+                self._configdict[alias] = self._configdict[name]
+                setattr(self, alias, self._configdict[name])
 
     def configurations_str(self):
         deg = 180 / np.pi
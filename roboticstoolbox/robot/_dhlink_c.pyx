@@ -0,0 +1,32 @@
+# cython: boundscheck=False, wraparound=False, language_level=3
+"""
+Compiled kernels for DHLink.A_ndarray
+
+Fill the joint dependent elements of a revolute link transform, the other
+elements are copied from DHLink._T_const.  These are the ahead-of-time
+compiled equivalent of the Numba kernels in DHLink.py, used in preference
+to them when the extension has been built, see ``setup.py``.
+"""
+
+
+cpdef void A_sdh(
+        double ca, double sa, double ct, double st, double a,
+        double[:, ::1] out):
+    out[0, 0] = ct
+    out[0, 1] = -st * ca
+    out[0, 2] = st * sa
+    out[0, 3] = a * ct
+    out[1, 0] = st
+    out[1, 1] = ct * ca
+    out[1, 2] = -ct * sa
+    out[1, 3] = a * st
+
+
+cpdef void A_mdh(
+        double ca, double sa, double ct, double st, double[:, ::1] out):
+    out[0, 0] = ct
+    out[0, 1] = -st
+    out[1, 0] = st * ca
+    out[1, 1] = ct * ca
+    out[2, 0] = st * sa
+    out[2, 1] = ct * sa
@@ -0,0 +1,325 @@
+"""
+Generate straight-line forward kinematics code for a particular robot
+"""
+
+import os
+import hashlib
+import importlib.util
+from pathlib import Path
+import numpy as np
+
+try:  # pragma: no cover
+    import sympy as sym
+except ImportError:  # pragma: no cover
+    sym = None
+
+try:  # pragma: no cover
+    from Cython.Build import cythonize
+    _cython = True
+except ImportError:  # pragma: no cover
+    _cython = False
+
+_header = '''\
+# flake8: noqa
+"""
+Forward kinematics for the {name} robot
+
+Generated by roboticstoolbox.tools.codegen, do not edit.  The constant link
+transforms are folded into the expressions, only the joint coordinates
+remain as variables.
+"""
+
+from math import sin, cos
+import numpy as np
+'''
+
+_header_pyx = '''\
+# cython: boundscheck=False, wraparound=False, language_level=3
+"""
+Forward kinematics for the {name} robot, compiled with Cython
+
+Generated by roboticstoolbox.tools.codegen, do not edit.  The same
+expressions as the Python module, with typed locals and C math functions.
+"""
+
+from libc.math cimport sin, cos
+import numpy as np
+'''
+
+
+def _clean(M, tol=1e-12):
+    # snap numerical noise in the constant transforms to 0 and ±1 so that the
+    # terms vanish, or lose a multiply, when the chain is expanded
+    M = np.array(M, dtype=np.float64)
+    S = sym.zeros(*M.shape)
+    for i, j in np.ndindex(M.shape):
+        for v in (0, 1, -1):
+            if abs(M[i, j] - v) < tol:
+                S[i, j] = sym.Integer(v)
+                break
+        else:
+            S[i, j] = sym.Float(M[i, j])
+    return S
+
+
+def fkine_expr(ets, n):
+    """
+    Symbolic forward kinematics of an ETS
+
+    :param ets: elementary transform sequence
+    :type ets: ETS
+    :param n: number of joints
+    :type n: int
+    :return: symbolic SE(3) matrix and joint symbols
+    :rtype: sympy.Matrix(4,4), list of n sympy.Symbol
+
+    Constant transforms are numeric and joint transforms are expressed in
+    terms of symbols ``q0`` ... ``q{n-1}``.  Constant elements that are
+    numerically 0 or ±1 are made exact so that those terms vanish when the
+    chain is multiplied out.
+    """
+    if sym is None:  # pragma: no cover
+        raise ImportError(
+            "SymPy is required for code generation, "
+            "install using pip install sympy")
+
+    q = sym.symbols(f"q0:{n}", real=True)
+
+    T = sym.eye(4)
+    j = 0
+    for et in ets:
+        if et.isjoint:
+            jindex = et.jindex if et.jindex is not None else j
+            j += 1
+            qj = -q[jindex] if et.isflip else q[jindex]
+            A = sym.Matrix(et.axis_func(qj))
+        else:
+            A = _clean(et.T())
+        T = T * A
+
+    return T, list(q)
+
+
+def _fkine_cse(robot):
+    # forward kinematics as common subexpressions and the 12 elements of the
+    # top 3 rows, the bottom row is always [0 0 0 1]
+    T, q = fkine_expr(robot.ets(), robot.n)
+
+    exprs = [T[i, j] for i in range(3) for j in range(4)]
+    subexprs, exprs = sym.cse(exprs, symbols=sym.numbered_symbols("x"))
+
+    return ", ".join([str(qj) for qj in q]), subexprs, exprs
+
+
+def fkine_codegen(robot, filename=None, name=None):
+    """
+    Generate a Python module for robot forward kinematics
+
+    :param robot: the robot model
+    :type robot: ERobot or DHRobot
+    :param filename: file to write the module to, optional
+    :type filename: str or Path
+    :param name: robot name for the module docstring, defaults to robot.name
+    :type name: str
+    :return: module source code
+    :rtype: str
+
+    The module contains a function ``fkine(q0, ..., qn)`` that returns the
+    pose of the end-effector as an ndarray(4,4), computed as straight-line
+    code with common subexpressions factored out.  The base and tool
+    transforms of the robot are not included.
+
+    It also contains ``fkine_out(q0, ..., qn, T)`` which writes the pose into
+    the existing array ``T``.  It does not allocate, so it can be compiled as
+    a Numba CUDA device function.
+
+    The module starts with ``# flake8: noqa``, as the generated expressions
+    are not wrapped to the line length limit.
+
+    Example::
+
+        >>> robot = rtb.models.URDF.OmronTM5_700()
+        >>> fkine_codegen(robot, "_OmronTM5_700_fk.py")
+    """
+    args, subexprs, exprs = _fkine_cse(robot)
+
+    if name is None:
+        name = robot.name
+
+    src = _header.format(name=name)
+
+    body = ""
+    for x, e in subexprs:
+        body += f"    {x} = {sym.pycode(e, fully_qualified_modules=False)}\n"
+
+    src += f"\n\ndef fkine({args}):\n" + body
+    src += "    return np.array([\n"
+    for i in range(3):
+        row = ", ".join(
+            [sym.pycode(e, fully_qualified_modules=False)
+                for e in exprs[i * 4:i * 4 + 4]])
+        src += f"        [{row}],\n"
+    src += "        [0.0, 0.0, 0.0, 1.0]])\n"
+
+    src += f"\n\ndef fkine_out({args}, T):\n" + body
+    for i in range(3):
+        for j in range(4):
+            e = sym.pycode(exprs[i * 4 + j], fully_qualified_modules=False)
+            src += f"    T[{i}, {j}] = {e}\n"
+    src += "    T[3, 0] = 0.0\n"
+    src += "    T[3, 1] = 0.0\n"
+    src += "    T[3, 2] = 0.0\n"
+    src += "    T[3, 3] = 1.0\n"
+
+    if filename is not None:
+        with open(filename, "w") as f:
+            f.write(src)
+
+    return src
+
+
+def fkine_codegen_pyx(robot, filename=None, name=None):
+    """
+    Generate a Cython module for robot forward kinematics
+
+    :param robot: the robot model
+    :type robot: ERobot or DHRobot
+    :param filename: file to write the module to, optional
+    :type filename: str or Path
+    :param name: robot name for the module docstring, defaults to robot.name
+    :type name: str
+    :return: module source code
+    :rtype: str
+
+    As for :func:`fkine_codegen` but the module is Cython source, with all
+    variables typed as ``double``, and contains only ``fkine(q0, ..., qn)``.
+    It must be compiled, see ``setup.py``.
+
+    Example::
+
+        >>> robot = rtb.models.URDF.OmronTM5_700()
+        >>> fkine_codegen_pyx(robot, "_OmronTM5_700_fk_cy.pyx")
+    """
+    args, subexprs, exprs = _fkine_cse(robot)
+
+    if name is None:
+        name = robot.name
+
+    src = _header_pyx.format(name=name)
+
+    cargs = ", ".join(["double " + qj for qj in args.split(", ")])
+    src += f"\n\ndef fkine({cargs}):\n"
+    if len(subexprs) > 0:
+        src += "    cdef double " + ", ".join(
+            [str(x) for x, _ in subexprs]) + "\n"
+    src += "    T = np.empty((4, 4))\n"
+    src += "    cdef double[:, ::1] Tv = T\n\n"
+
+    for x, e in subexprs:
+        src += f"    {x} = {sym.pycode(e, fully_qualified_modules=False)}\n"
+    for i in range(3):
+        for j in range(4):
+            e = sym.pycode(exprs[i * 4 + j], fully_qualified_modules=False)
+            src += f"    Tv[{i}, {j}] = {e}\n"
+    src += "    Tv[3, 0] = 0.0\n"
+    src += "    Tv[3, 1] = 0.0\n"
+    src += "    Tv[3, 2] = 0.0\n"
+    src += "    Tv[3, 3] = 1.0\n"
+    src += "    return T\n"
+
+    if filename is not None:
+        with open(filename, "w") as f:
+            f.write(src)
+
+    return src
+
+
+def _cachedir():
+    # per-user cache of generated modules, ~/.cache/rtb by default
+    root = os.environ.get("XDG_CACHE_HOME", "~/.cache")
+    return Path(root).expanduser() / "rtb"
+
+
+def _load_module(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _build_pyx(name, pyx, cachedir):  # pragma: no cover
+    # compile a Cython module in place, returns the path of the extension
+    from setuptools import Distribution, Extension
+
+    ext = cythonize(
+        [Extension(name, [str(pyx)], include_dirs=[np.get_include()])],
+        quiet=True, language_level=3, build_dir=str(cachedir / "build"))
+    dist = Distribution({"ext_modules": ext})
+    cmd = dist.get_command_obj("build_ext")
+    cmd.build_lib = str(cachedir)
+    cmd.build_temp = str(cachedir / "build")
+    cmd.ensure_finalized()
+    cmd.run()
+    return cmd.get_outputs()[0]
+
+
+def fkine_compile(robot, compiled=True, cachedir=None):
+    """
+    Generate and load a forward kinematics module for a robot
+
+    :param robot: the robot model
+    :type robot: ERobot or DHRobot
+    :param compiled: compile the module with Cython if available
+    :type compiled: bool
+    :param cachedir: directory for generated modules, defaults to
+        ``~/.cache/rtb``
+    :type cachedir: str or Path
+    :return: forward kinematics module
+    :rtype: module
+
+    Generates the module source with :func:`fkine_codegen_pyx`, or
+    :func:`fkine_codegen` if Cython is not installed or ``compiled`` is
+    False, and imports it.  The module is named by a hash of its source, which
+    includes all the kinematic parameters as literals, so a robot with the
+    same kinematics reuses the module in ``cachedir`` rather than
+    generating and compiling it again.
+
+    Example::
+
+        >>> robot = rtb.models.DH.Puma560()
+        >>> fk = fkine_compile(robot)
+        >>> fk.fkine(*robot.qr)
+    """
+    if cachedir is None:
+        cachedir = _cachedir()
+    cachedir = Path(cachedir)
+    cachedir.mkdir(parents=True, exist_ok=True)
+
+    if compiled and _cython:  # pragma: no cover
+        src = fkine_codegen_pyx(robot)
+        name = "_fk_" + hashlib.sha1(src.encode()).hexdigest()[:16]
+        for path in cachedir.glob(name + ".*"):
+            if path.suffix not in (".pyx", ".c"):
+                return _load_module(name, path)
+
+        pyx = cachedir / (name + ".pyx")
+        pyx.write_text(src)
+        return _load_module(name, _build_pyx(name, pyx, cachedir))
+
+    src = fkine_codegen(robot)
+    name = "_fk_" + hashlib.sha1(src.encode()).hexdigest()[:16]
+    path = cachedir / (name + ".py")
+    if not path.exists():
+        path.write_text(src)
+    return _load_module(name, path)
+
+
+if __name__ == "__main__":   # pragma nocover
+    import roboticstoolbox as rtb
+
+    # regenerate the specialized forward kinematics shipped with models
+    urdf = Path(rtb.models.URDF.__file__).parent
+    robot = rtb.models.URDF.OmronTM5_700()
+    fkine_codegen(robot, urdf / "_OmronTM5_700_fk.py", name="OmronTM5_700")
+    fkine_codegen_pyx(
+        robot, urdf / "_OmronTM5_700_fk_cy.pyx", name="OmronTM5_700")
@@ -9,6 +9,7 @@ import roboticstoolbox as rtb
 import spatialgeometry as gm
 import copy
 import os
+from functools import lru_cache
 import xml.etree.ElementTree as ET
 import spatialmath as sm
 from io import BytesIO
@@ -18,6 +19,13 @@ from roboticstoolbox.tools.data import path_to_datafile
 from .utils import (parse_origin, configure_origin)
 
 
+@lru_cache(maxsize=None)
+def _mesh_path(value):
+    # resolving the path touches the filesystem several times and is done
+    # for every mesh of every link, but the same few files recur
+    return str(path_to_datafile('xacro', value))
+
+
 class URDFType(object):
     """Abstract base class for all URDF types.
     This has useful class methods for automatic parsing/unparsing
@@ -304,9 +312,7 @@ class Mesh(URDFType):
         if value.startswith('package://'):
             value = value.replace('package://', '')
 
-        value = path_to_datafile('xacro', value)
-
-        self._filename = str(value)
+        self._filename = _mesh_path(value)
 
     @property
     def scale(self):
@@ -92,6 +92,27 @@ fknm = Extension(
         numpy.get_include()
     ])
 
+ext_modules = [frne, fknm]
+
+# generated model kinematics and DH link kernels, optional since they have a
+# Python fallback
+try:
+    from Cython.Build import cythonize
+
+    ext_modules += cythonize(
+        [
+            Extension(
+                'roboticstoolbox.models.URDF._OmronTM5_700_fk_cy',
+                sources=[
+                    './roboticstoolbox/models/URDF/_OmronTM5_700_fk_cy.pyx']),
+            Extension(
+                'roboticstoolbox.robot._dhlink_c',
+                sources=['./roboticstoolbox/robot/_dhlink_c.pyx'])
+        ],
+        language_level=3)
+except ImportError:
+    pass
+
 setup(
     name='roboticstoolbox-python',
 
@@ -137,7 +158,7 @@ setup(
         'Coverage': 'https://codecov.io/gh/petercorke/roboticstoolbox-python'
     },
 
-    ext_modules=[frne, fknm],
+    ext_modules=ext_modules,
 
     keywords='python robotics robotics-toolbox kinematics dynamics' \
              ' motion-planning trajectory-generation jacobian hessian' \
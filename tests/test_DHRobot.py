@@ -9,6 +9,8 @@ import roboticstoolbox as rp
 import spatialmath as sm
 import unittest
 import math
+import tempfile
+import importlib.util
 
 
 class TestDHRobot(unittest.TestCase):
@@ -207,6 +209,217 @@ class TestDHRobot(unittest.TestCase):
         nt.assert_array_almost_equal(TT[2].A, T1)
         nt.assert_array_almost_equal(TT[3].A, T1)
 
+    def test_fkine_batch(self):
+        puma = rp.models.DH.Puma560()
+        puma.base = sm.SE3.Tz(0.5)
+        puma.tool = sm.SE3.Tx(0.1)
+        Q = np.random.rand(10, 6)
+
+        T = puma.fkine_batch(Q)
+        self.assertEqual(T.shape, (10, 4, 4))
+        for k in range(10):
+            nt.assert_array_almost_equal(T[k], puma.fkine(Q[k]).A)
+
+        l0 = rp.PrismaticMDH(theta=0.3, alpha=0.2, a=1)
+        l1 = rp.RevoluteMDH(d=0.5, alpha=-0.4, flip=True, offset=0.2)
+        r0 = rp.DHRobot([l0, l1])
+        Q = np.random.rand(5, 2)
+        T = r0.fkine_batch(Q)
+        for k in range(5):
+            nt.assert_array_almost_equal(T[k], r0.fkine(Q[k]).A)
+
+        l2 = rp.PrismaticDH(theta=2.0, flip=True)
+        l3 = rp.RevoluteDH(a=0.3, alpha=0.1)
+        r1 = rp.DHRobot([l2, l3])
+        T = r1.fkine_batch(Q)
+        for k in range(5):
+            nt.assert_array_almost_equal(T[k], r1.fkine(Q[k]).A)
+
+    def test_fkine_fused(self):
+        puma = rp.models.DH.Puma560()
+        puma.base = sm.SE3.Tz(0.5)
+        puma.tool = sm.SE3.Tx(0.1)
+        q = np.random.rand(6)
+        nt.assert_array_almost_equal(puma.fkine_fused(q), puma.fkine(q).A)
+
+        # flip, offset and prismatic joints, both conventions
+        l0 = rp.PrismaticMDH(theta=0.3, alpha=0.2, a=1)
+        l1 = rp.RevoluteMDH(d=0.5, alpha=-0.4, flip=True, offset=0.2)
+        r0 = rp.DHRobot([l0, l1])
+        nt.assert_array_almost_equal(
+            r0.fkine_fused([0.3, -0.7]), r0.fkine([0.3, -0.7]).A)
+
+        l2 = rp.PrismaticDH(theta=2.0, flip=True, offset=0.1)
+        l3 = rp.RevoluteDH(a=0.3, alpha=0.1)
+        r1 = rp.DHRobot([l2, l3])
+        nt.assert_array_almost_equal(
+            r1.fkine_fused([0.3, -0.7]), r1.fkine([0.3, -0.7]).A)
+
+        # symbolic parameters use the general method
+        puma = rp.models.DH.Puma560(symbolic=True)
+        T = puma.fkine_fused(np.zeros(6))
+        self.assertEqual(T.shape, (4, 4))
+
+    def test_fkine_incremental(self):
+        puma = rp.models.DH.Puma560()
+        puma.base = sm.SE3.Tz(0.5)
+        puma.tool = sm.SE3.Tx(0.1)
+        q = np.random.rand(6)
+        nt.assert_array_almost_equal(
+            puma.fkine_incremental(q), puma.fkine(q).A)
+
+        # change one joint at a time, the first and last included
+        for j in [5, 2, 0]:
+            q[j] += 0.1
+            nt.assert_array_almost_equal(
+                puma.fkine_incremental(q), puma.fkine(q).A)
+        nt.assert_array_almost_equal(
+            puma.fkine_incremental(q), puma.fkine(q).A)
+
+        # the result is not a view of the kept frames
+        puma.base = None
+        puma.tool = None
+        T = puma.fkine_incremental(q)
+        T[0, 0] = 10
+        nt.assert_array_almost_equal(
+            puma.fkine_incremental(q), puma.fkine(q).A)
+
+        # a link parameter change discards the kept frames
+        puma.links[4].a = 0.2
+        nt.assert_array_almost_equal(
+            puma.fkine_incremental(q), puma.fkine(q).A)
+
+        # symbolic parameters use the general method
+        puma = rp.models.DH.Puma560(symbolic=True)
+        T = puma.fkine_incremental(np.zeros(6))
+        self.assertEqual(T.shape, (4, 4))
+
+    def test_dh_params(self):
+        l0 = rp.PrismaticMDH(theta=0.3, alpha=0.2, a=1)
+        l1 = rp.RevoluteMDH(d=0.5, alpha=-0.4, flip=True, offset=0.2)
+        P = rp.DHLink.pack_chain([l0, l1])
+        nt.assert_array_almost_equal(P, [
+            [1, 0.2, 0.3, 0, 1, 0, 0],
+            [0, -0.4, 0, 0.5, 0, 0.2, 1]])
+
+        # cached by the robot until a link parameter changes
+        r0 = rp.DHRobot([l0, l1])
+        self.assertIs(r0._dh_params(), r0._dh_params())
+        T = r0.fkine_fused([0.3, -0.7])
+        l1.offset = 0.5
+        self.assertEqual(r0._dh_params()[1, 5], 0.5)
+        l1.flip = False
+        self.assertEqual(r0._dh_params()[1, 6], 0)
+        l0.a = 2
+        self.assertEqual(r0._dh_params()[0, 0], 2)
+        self.assertFalse(np.allclose(r0.fkine_fused([0.3, -0.7]), T))
+        nt.assert_array_almost_equal(
+            r0.fkine_fused([0.3, -0.7]), r0.fkine([0.3, -0.7]).A)
+
+    def test_dyn_arrays(self):
+        puma = rp.models.DH.Puma560()
+        D = puma.dyn_arrays()
+        self.assertIs(puma.dyn_arrays(), D)
+        self.assertEqual(D.I.shape, (6, 6))
+        self.assertEqual(D.Tc.shape, (6, 2))
+        for j, link in enumerate(puma.links):
+            self.assertEqual(D.m[j], link.m)
+            nt.assert_array_almost_equal(D.r[j], link.r)
+            nt.assert_array_almost_equal(
+                D.I[j], link.I[[0, 1, 2, 0, 1, 0], [0, 1, 2, 1, 2, 2]])
+
+        # rebuilt after a change, and used by rne
+        q = puma.qn
+        tau = puma.rne(q, np.zeros(6), np.zeros(6))
+        puma.links[2].m = 2 * puma.links[2].m
+        D = puma.dyn_arrays()
+        self.assertEqual(D.m[2], puma.links[2].m)
+        self.assertFalse(np.allclose(
+            puma.rne(q, np.zeros(6), np.zeros(6)), tau))
+
+    def test_fkine_xp(self):
+        from roboticstoolbox.robot.DHRobot import _fkine_xp
+
+        # the array-module kernel behind fkine_torch and fkine_jax, run on
+        # NumPy
+        puma = rp.models.DH.Puma560()
+        Q = np.random.rand(10, 6)
+        T = _fkine_xp(np, Q, puma._dh_params(), puma.mdh)
+        nt.assert_array_almost_equal(T, puma.fkine_batch(Q))
+
+        frames = _fkine_xp(np, Q, puma._dh_params(), puma.mdh, frames=True)
+        self.assertEqual(frames.shape, (10, 6, 4, 4))
+        nt.assert_array_almost_equal(frames[:, -1], T)
+        nt.assert_array_almost_equal(
+            frames[3, 2], puma.A(2, Q[3]).A)
+
+        l0 = rp.PrismaticMDH(theta=0.3, alpha=0.2, a=1)
+        l1 = rp.RevoluteMDH(d=0.5, alpha=-0.4, flip=True, offset=0.2)
+        r0 = rp.DHRobot([l0, l1])
+        Q = np.random.rand(5, 2)
+        nt.assert_array_almost_equal(
+            _fkine_xp(np, Q, r0._dh_params(), r0.mdh), r0.fkine_batch(Q))
+
+        self.assertIsNone(rp.models.DH.Puma560(symbolic=True)._dh_params())
+
+    def test_chain_to_tensor(self):
+        puma = rp.models.DH.Puma560()
+        P = rp.DHLink.chain_to_tensor(puma.links, backend='numpy')
+        nt.assert_array_equal(P, puma._dh_params())
+        P = rp.DHLink.chain_to_tensor(
+            puma.links, backend='numpy', dtype=np.float32)
+        self.assertEqual(P.dtype, np.float32)
+
+        with self.assertRaises(ValueError):
+            rp.DHLink.chain_to_tensor(puma.links, backend='nosuchbackend')
+        with self.assertRaises(ValueError):
+            rp.DHLink.chain_to_tensor(
+                rp.models.DH.Puma560(symbolic=True).links, backend='numpy')
+
+    @unittest.skipUnless(
+        importlib.util.find_spec("torch"), "PyTorch not installed")
+    def test_fkine_torch(self):  # pragma: no cover
+        puma = rp.models.DH.Puma560()
+        puma.tool = sm.SE3.Tx(0.1)
+        Q = np.random.rand(10, 6)
+        T = puma.fkine_torch(Q)
+        nt.assert_array_almost_equal(T.numpy(), puma.fkine_batch(Q))
+
+        P = rp.DHLink.chain_to_tensor(puma.links)
+        self.assertEqual(tuple(P.shape), (6, 7))
+
+    @unittest.skipUnless(
+        importlib.util.find_spec("jax"), "JAX not installed")
+    def test_fkine_jax(self):  # pragma: no cover
+        puma = rp.models.DH.Puma560()
+        puma.tool = sm.SE3.Tx(0.1)
+        Q = np.random.rand(10, 6).astype(np.float32)
+        T = puma.fkine_jax(Q)
+        nt.assert_array_almost_equal(
+            np.asarray(T), puma.fkine_batch(Q), decimal=4)
+
+    def test_codegen(self):
+        puma = rp.models.DH.Puma560()
+        puma.base = sm.SE3.Tz(0.5)
+        puma.tool = sm.SE3.Tx(0.1)
+        q = np.random.rand(6)
+
+        with tempfile.TemporaryDirectory() as cachedir:
+            fk = puma.codegen(compiled=False, cachedir=cachedir)
+            nt.assert_array_almost_equal(fk.fkine(*q), puma.fkine(q).A)
+
+            # the same robot reuses the module
+            fk2 = puma.codegen(compiled=False, cachedir=cachedir)
+            self.assertEqual(fk.__name__, fk2.__name__)
+
+            # offset and flip are folded into the generated code
+            l0 = rp.PrismaticMDH(theta=0.3, alpha=0.2, a=1)
+            l1 = rp.RevoluteMDH(d=0.5, alpha=-0.4, flip=True, offset=0.2)
+            r0 = rp.DHRobot([l0, l1])
+            fk = r0.codegen(compiled=False, cachedir=cachedir)
+            nt.assert_array_almost_equal(
+                fk.fkine(0.3, -0.7), r0.fkine([0.3, -0.7]).A)
+
     def test_links(self):
         l0 = rp.PrismaticDH()
         with self.assertRaises(TypeError):
@@ -363,6 +576,11 @@ class TestDHRobot(unittest.TestCase):
         nt.assert_array_equal(panda.islimit(q), ans)
         nt.assert_array_equal(panda.islimit(), ans)
 
+        # trajectory, one row per configuration
+        Q = np.array([q, panda.qz])
+        nt.assert_array_equal(
+            panda.islimit(Q), [ans, panda.islimit(panda.qz)])
+
     def test_isspherical(self):
         l0 = rp.RevoluteDH()
         l1 = rp.RevoluteDH(alpha=-np.pi / 2)
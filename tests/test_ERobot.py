@@ -25,6 +25,21 @@ class TestERobot(unittest.TestCase):
         self.assertEqual(robot.manufacturer, 'I made it')
         self.assertEqual(robot.comment, 'other stuff')
 
+    def test_URDF_read_abspath(self):
+        from roboticstoolbox.tools.data import path_to_datafile
+        file = "ur_description/urdf/ur5_joint_limited_robot.urdf.xacro"
+
+        links, name = ERobot.URDF_read(file)
+        links2, name2 = ERobot.URDF_read(
+            str(path_to_datafile("xacro", file)))
+        self.assertEqual(name, name2)
+        self.assertEqual(
+            [link.name for link in links], [link.name for link in links2])
+
+        # native path object
+        links3, name3 = ERobot.URDF_read(path_to_datafile("xacro", file))
+        self.assertEqual(name, name3)
+
     def test_init_ets(self):
         ets = rtb.ETS.tx(-0.0825) * rtb.ETS.rz() * rtb.ETS.tx(-0.0825) \
             * rtb.ETS.tz() * rtb.ETS.tx(0.1)
@@ -10,6 +10,12 @@ import numpy as np
 import roboticstoolbox as rp
 import spatialmath as sm
 import unittest
+import sys
+
+try:
+    from roboticstoolbox.robot import _dhlink_c
+except ImportError:
+    _dhlink_c = None
 
 
 class TestDHLink(unittest.TestCase):
@@ -30,6 +36,18 @@ class TestDHLink(unittest.TestCase):
         self.assertEqual(l0.islimit(-1.9), True)
         self.assertEqual(l0.islimit(2.9), True)
 
+        nt.assert_array_equal(
+            l0.islimit(np.array([-0.9, -1.9, 2.9])), [False, True, True])
+
+        # limits modified in place
+        l0.qlim[1] = 3
+        self.assertEqual(l0.islimit(2.0), False)
+        nt.assert_array_equal(l0.islimit([2.0, 3.5]), [False, True])
+
+        l0.qlim = None
+        self.assertEqual(l0.islimit(2.9), False)
+        nt.assert_array_equal(l0.islimit([-1.9, 2.9]), [False, False])
+
     def test_Tc(self):
         l0 = rp.DHLink(Tc=1)
         l1 = rp.DHLink(Tc=[1])
@@ -43,6 +61,15 @@ class TestDHLink(unittest.TestCase):
         nt.assert_array_almost_equal(l1.Tc, Tc1)
         nt.assert_array_almost_equal(l2.Tc, Tc2)
 
+        # ndarray argument is copied
+        Tc = np.array([1.0, -2.0])
+        l2.Tc = Tc
+        Tc[0] = 5
+        nt.assert_array_almost_equal(l2.Tc, [1, -2])
+
+        with self.assertRaises(ValueError):
+            l2.Tc = [1, 2, 3]
+
     def test_I(self):
         l0 = rp.DHLink(I=[1, 2, 3])
         l1 = rp.DHLink(I=[0, 1, 2, 3, 4, 5])
@@ -66,6 +93,14 @@ class TestDHLink(unittest.TestCase):
         nt.assert_array_almost_equal(l1.I, I1)
         nt.assert_array_almost_equal(l2.I, I2)
 
+        # row and column vectors, nested lists
+        l0.I = np.array([[0, 1, 2, 3, 4, 5]])  # noqa
+        nt.assert_array_almost_equal(l0.I, I1)
+        l0.I = np.c_[[1, 2, 3]]  # noqa
+        nt.assert_array_almost_equal(l0.I, I0)
+        l0.I = I1.tolist()  # noqa
+        nt.assert_array_almost_equal(l0.I, I1)
+
     def test_A(self):
         l0 = rp.DHLink(sigma=0)
         l1 = rp.DHLink(sigma=1)
@@ -93,6 +128,141 @@ class TestDHLink(unittest.TestCase):
         nt.assert_array_almost_equal(l3.A(np.pi).A, T1.A)
         nt.assert_array_almost_equal(l4.A(np.pi).A, T0.A)
 
+        self.assertIsInstance(l0.A_ndarray(np.pi), np.ndarray)
+        nt.assert_array_almost_equal(l0.A_ndarray(np.pi), T0.A)
+        nt.assert_array_almost_equal(l3.A_ndarray(np.pi), T1.A)
+
+        # result written into a given array
+        out = np.zeros((4, 4))
+        self.assertIs(l0.A_ndarray(np.pi, out=out), out)
+        nt.assert_array_almost_equal(out, T0.A)
+        self.assertIs(l3.A_ndarray(0, out=out), out)
+        nt.assert_array_almost_equal(out, l3.A_ndarray(0))
+
+    def test_A_setters(self):
+        # sin/cos of alpha and theta are cached by the setters
+        l0 = rp.RevoluteDH(a=1, alpha=0.3)
+        l0.alpha = np.pi / 2
+        T = sm.SE3.Rz(0.2) * sm.SE3.Tx(1) * sm.SE3.Rx(np.pi / 2)
+        nt.assert_array_almost_equal(l0.A(0.2).A, T.A)
+
+        l1 = rp.PrismaticMDH(theta=0.3, alpha=0.1)
+        l1.theta = 0.5
+        l1.alpha = -0.4
+        T = sm.SE3.Rx(-0.4) * sm.SE3.Rz(0.5) * sm.SE3.Tz(2)
+        nt.assert_array_almost_equal(l1.A(2).A, T.A)
+
+    def test_A_const(self):
+        # constant part of the transform is rebuilt when a parameter changes
+        l0 = rp.RevoluteMDH(a=1, d=0.2, alpha=0.3)
+        l0.A(0.1)
+        l0.d = 0.5
+        l0.a = 2
+        T = sm.SE3.Tx(2) * sm.SE3.Rx(0.3) * sm.SE3.Rz(0.1) * sm.SE3.Tz(0.5)
+        nt.assert_array_almost_equal(l0.A(0.1).A, T.A)
+
+        l1 = rp.PrismaticDH(theta=0.3, a=1)
+        l1.A(0.1)
+        l1.a = 2
+        T = sm.SE3.Rz(0.3) * sm.SE3.Tz(0.1) * sm.SE3.Tx(2)
+        nt.assert_array_almost_equal(l1.A(0.1).A, T.A)
+
+    @unittest.skipIf(_dhlink_c is None, "Cython kernels not built")
+    def test_A_cython(self):
+        l0 = rp.RevoluteDH(a=1, d=0.2, alpha=0.3)
+        T = l0._const_transform()
+        _dhlink_c.A_sdh(
+            np.cos(0.3), np.sin(0.3), np.cos(0.1), np.sin(0.1), 1, T)
+        nt.assert_array_almost_equal(T, l0.A(0.1).A)
+
+        l1 = rp.RevoluteMDH(a=1, d=0.2, alpha=0.3)
+        T = l1._const_transform()
+        _dhlink_c.A_mdh(
+            np.cos(0.3), np.sin(0.3), np.cos(0.1), np.sin(0.1), T)
+        nt.assert_array_almost_equal(T, l1.A(0.1).A)
+
+    def test_A_flip_offset(self):
+        l0 = rp.RevoluteDH(a=1, alpha=0.3)
+        self.assertTrue(l0._qidentity)
+        T = l0.A_ndarray(0.2)
+
+        l0.offset = 0.1
+        self.assertFalse(l0._qidentity)
+        nt.assert_array_almost_equal(l0.A_ndarray(0.1), T)
+
+        l0.offset = 0
+        l0.flip = True
+        self.assertFalse(l0._qidentity)
+        self.assertEqual(l0._flip_sign, -1)
+        nt.assert_array_almost_equal(l0.A_ndarray(-0.2), T)
+
+        l0.flip = False
+        self.assertTrue(l0._qidentity)
+        nt.assert_array_almost_equal(l0.A_ndarray(0.2), T)
+
+        l1 = rp.PrismaticDH(flip=True, offset=0.5)
+        nt.assert_array_almost_equal(l1.A_ndarray(0.2)[2, 3], 0.3)
+
+    def test_A_batch(self):
+        q = np.linspace(-1, 1, 5)
+        for link in [
+                rp.RevoluteDH(a=1, d=0.2, alpha=0.3, offset=0.1),
+                rp.RevoluteMDH(a=1, d=0.2, alpha=0.3, flip=True),
+                rp.PrismaticDH(a=1, theta=0.4, alpha=np.pi / 2),
+                rp.PrismaticMDH(a=1, theta=0.4, alpha=0.3, offset=0.5)]:
+            T = link.A_batch(q)
+            self.assertEqual(T.shape, (5, 4, 4))
+            for k in range(5):
+                nt.assert_array_almost_equal(T[k], link.A_ndarray(q[k]))
+
+    def test_A_fn(self):
+        # the fill function follows a change of joint type or convention
+        l0 = rp.PrismaticMDH(a=1, alpha=0.3)
+        T = l0.A_ndarray(0.2)
+        nt.assert_array_almost_equal(
+            T[1:3, 3], [-0.2 * np.sin(0.3), 0.2 * np.cos(0.3)])
+
+        l0.mdh = False
+        nt.assert_array_almost_equal(
+            l0.A_ndarray(0.2), rp.PrismaticDH(a=1, alpha=0.3).A_ndarray(0.2))
+
+    def test_A_alpha(self):
+        from roboticstoolbox.robot.DHLink import _A_sdh_py, _A_mdh_py
+
+        # twists that are multiples of pi/2 give exact zeros
+        l0 = rp.RevoluteDH(a=1, alpha=np.pi / 2)
+        self.assertEqual(l0._ca, 0)
+        self.assertEqual(l0._sa, 1)
+        self.assertEqual(l0.A_ndarray(0.3)[2, 2], 0)
+        l0.alpha = -np.pi
+        self.assertEqual((l0._ca, l0._sa), (-1, 0))
+        l0.alpha = 0.3
+        self.assertAlmostEqual(l0._sa, np.sin(0.3))
+        nt.assert_array_almost_equal(
+            l0.trig_alpha, [np.cos(0.3), np.sin(0.3)])
+        self.assertEqual(rp.PrismaticMDH(alpha=np.pi / 2).trig_alpha, (0, 1))
+
+        # Python fallback kernels, for all quadrants
+        for alpha in [0, np.pi / 2, np.pi, -np.pi / 2, 0.3]:
+            for link in [
+                    rp.RevoluteDH(a=1, d=0.2, alpha=alpha),
+                    rp.RevoluteMDH(a=1, d=0.2, alpha=alpha)]:
+                T = link._const_transform()
+                if link.mdh:
+                    _A_mdh_py(link._ca, link._sa, np.cos(0.1), np.sin(0.1), T)
+                else:
+                    _A_sdh_py(
+                        link._ca, link._sa, np.cos(0.1), np.sin(0.1), 1, T)
+                nt.assert_array_almost_equal(T, link.A_ndarray(0.1))
+
+    def test_A_symbolic(self):
+        import spatialmath.base.symbolic as sym
+        q = sym.symbol('q')
+        l0 = rp.RevoluteDH(a=1, alpha=np.pi / 2)
+        T = l0.A(q)
+        self.assertTrue(sym.issymbol(T.A[0, 0]))
+        self.assertEqual(float(T.A[0, 3].subs(q, 0)), 1)
+
     def test_friction(self):
         l0 = rp.RevoluteDH(d=2, Tc=[2, -1], B=3, G=2)
 
@@ -101,6 +271,12 @@ class TestDHLink(unittest.TestCase):
 
         nt.assert_almost_equal(l0.friction(10), tau)
         nt.assert_almost_equal(l0.friction(-10), tau2)
+        nt.assert_almost_equal(l0.friction(0), 0)
+
+        nt.assert_array_almost_equal(
+            l0.friction(np.array([10, -10, 0])), [tau, tau2, 0])
+        nt.assert_array_almost_equal(
+            l0.friction(np.array([10, -10]), coulomb=False), [-120, 120])
 
     def test_nofriction(self):
         l0 = rp.DHLink(Tc=2, B=3)
@@ -209,6 +385,7 @@ qlim  =      -2.8 to      2.8""")  # noqa
         l0 = rp.RevoluteDH()
         r = rp.DHRobot([l0])
         l1 = l0.copy()
+        self.assertIsInstance(l1, rp.RevoluteDH)
         l0.m = 4
         l0.r[1] = 5
         self.assertEqual(l1.m, 0)
@@ -216,6 +393,48 @@ qlim  =      -2.8 to      2.8""")  # noqa
         self.assertIs(l0._robot, r)
         self.assertIs(l1._robot, r)
 
+    def test_slots(self):
+        l0 = rp.RevoluteDH(d=1, qlim=[-1, 1], m=2)
+        self.assertFalse(hasattr(l0, '__dict__'))
+        with self.assertRaises(AttributeError):
+            l0.nosuchattribute = 1
+
+        l1 = l0.copy()
+        self.assertEqual(l1.d, 1)
+        self.assertEqual(l1.m, 2)
+        self.assertIsNot(l1.qlim, l0.qlim)
+        nt.assert_array_almost_equal(l1.A(0.3).A, l0.A(0.3).A)
+
+        # the joint type subclasses add no per-instance storage
+        size = sys.getsizeof(rp.DHLink())
+        for cls in [
+                rp.RevoluteDH, rp.PrismaticDH,
+                rp.RevoluteMDH, rp.PrismaticMDH]:
+            link = cls()
+            self.assertFalse(hasattr(link, '__dict__'))
+            self.assertEqual(sys.getsizeof(link), size)
+
+        # default geometry is not shared between links
+        l2 = rp.RevoluteDH()
+        self.assertIsNot(l2.geometry, rp.RevoluteDH().geometry)
+        self.assertIsNot(l2.collision, rp.RevoluteDH().collision)
+
+    def test_notify(self):
+        l0 = rp.RevoluteDH()
+        l1 = rp.RevoluteDH()
+
+        r = rp.DHRobot([l0, l1])
+        r._dynchanged = False
+        l1.m = 2
+        self.assertTrue(r._dynchanged)
+        self.assertTrue(l1.hasdynamics)
+
+        # a rejected value is not a change
+        r._dynchanged = False
+        with self.assertRaises(ValueError):
+            l1.theta = 1
+        self.assertFalse(r._dynchanged)
+
     def test_I(self):  # noqa
         r = rp.models.DH.Puma560()
 
@@ -229,6 +448,16 @@ qlim  =      -2.8 to      2.8""")  # noqa
             I[1] = 4
             r.links[1].I = I  # noqa
 
+        with self.assertRaises(ValueError):
+            I = np.eye(3)  # noqa
+            I[1, 2] = 1e-6
+            r.links[1].I = I  # noqa
+
+        # within tolerance
+        I = np.eye(3)  # noqa
+        I[0, 2] = 1e-10
+        r.links[1].I = I  # noqa
+
         with self.assertRaises(ValueError):
             r.links[1].I = np.zeros(8)  # noqa
 
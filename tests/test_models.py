@@ -5,7 +5,15 @@
 
 import roboticstoolbox as rp
 import unittest
+import os
+import sys
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+import numpy as np
 import numpy.testing as nt
+from spatialmath import SE3
 
 
 class TestModels(unittest.TestCase):
@@ -23,6 +31,26 @@ class TestModels(unittest.TestCase):
         puma.qn
         puma = rp.models.DH.Puma560(symbolic=True)
 
+    def test_configuration_alias(self):
+        puma = rp.models.DH.Puma560()
+        puma.add_configuration_alias("home", "qz")
+        self.assertIs(puma.home, puma.qz)
+        self.assertIs(puma._configdict["home"], puma.qz)
+
+        # alias of an alias, follows a redefinition of the original
+        puma.add_configuration_alias("home2", "home")
+        puma.addconfiguration("qz", np.ones(6))
+        nt.assert_array_almost_equal(puma.home2, np.ones(6))
+        self.assertIs(puma.home, puma.qz)
+
+        # redefining the alias detaches it
+        puma.addconfiguration("home", np.zeros(6))
+        puma.addconfiguration("qz", np.full(6, 2))
+        nt.assert_array_almost_equal(puma.home, np.zeros(6))
+
+        with self.assertRaises(ValueError):
+            puma.add_configuration_alias("foo", "nosuchconfig")
+
     def test_pumaURDF(self):
         puma = rp.models.Puma560()
         puma.qr
@@ -50,6 +78,253 @@ class TestModels(unittest.TestCase):
         ur.qr
         ur.qz
 
+    def test_OmronTM5_700(self):
+        r1 = rp.models.URDF.OmronTM5_700()
+        r1.qr
+        r1.qz
+        self.assertIsNotNone(rp.models.URDF.OmronTM5_700._urdf_cache)
+
+        # second instance copies the links of the prototype
+        r2 = rp.models.URDF.OmronTM5_700()
+        self.assertIsNot(r1.links[0], r2.links[0])
+        self.assertIsNot(r1.links[2].geometry[0], r2.links[2].geometry[0])
+        self.assertIs(r2.links[1].parent, r2.links[0])
+        nt.assert_array_almost_equal(
+            r1.fkine(r1.qr).A, r2.fkine(r2.qr).A)
+        nt.assert_array_almost_equal(
+            r1.fkine(r1.qr, fast=True), r2.fkine(r2.qr, fast=True))
+
+        # instances do not share link state
+        r1._set_link_fk(r1.qz)
+        T = r1.links[8].geometry[0].wT.copy()
+        r2._set_link_fk(r2.qr)
+        nt.assert_array_almost_equal(r1.links[8].geometry[0].wT, T)
+        self.assertFalse(np.allclose(r2.links[8].geometry[0].wT, T))
+
+        # drop the in-memory caches, falls back to the .expanded.urdf file.
+        # They are restored afterwards, so other tests are not affected
+        cls = rp.models.URDF.OmronTM5_700
+        with mock.patch.object(cls, "_prototype", None), \
+                mock.patch.object(cls, "_urdf_cache", None):
+            r3 = cls()
+            nt.assert_array_almost_equal(
+                r1.fkine(r1.qr).A, r3.fkine(r3.qr).A)
+
+    def test_OmronTM5_700_xacro_key(self):
+        from roboticstoolbox.models.URDF.OmronTM5_700 import \
+            _xacro_key, _xacro_includes, _resolve_package_path
+
+        # the includes of the model, found through $(find ...)
+        path = _resolve_package_path(
+            "tm5_description/urdf/tm5_700_robot.urdf.xacro")
+        names = [f.name for f in _xacro_includes(path)]
+        self.assertIn("tm5_700.urdf.xacro", names)
+        self.assertIn("common.gazebo.xacro", names)
+
+        # modifying an included file changes the key
+        with tempfile.TemporaryDirectory() as tmp:
+            top = Path(tmp) / "top.xacro"
+            sub = Path(tmp) / "sub.xacro"
+            top.write_text(
+                '<robot><xacro:include filename="sub.xacro" /></robot>')
+            sub.write_text("<robot/>")
+            os.utime(top, (1000, 1000))
+            os.utime(sub, (2000, 2000))
+            self.assertEqual(_xacro_key(top), (str(top), 2000))
+
+            os.utime(sub, (3000, 3000))
+            self.assertEqual(_xacro_key(top), (str(top), 3000))
+
+        # the in-memory expansion is replaced when the key changes
+        cls = rp.models.URDF.OmronTM5_700
+        with mock.patch.object(
+                cls, "_urdf_cache", ((str(path), 0.0), "stale")):
+            cls._URDF_read_cached(
+                "tm5_description/urdf/tm5_700_robot.urdf.xacro")
+            self.assertEqual(cls._urdf_cache[0], _xacro_key(path))
+
+        # as is the prototype robot
+        with mock.patch.object(
+                cls, "_prototype", ((str(path), 0.0), None, "", True)):
+            r = cls()
+            self.assertEqual(r.n, 6)
+            self.assertEqual(cls._prototype[0], _xacro_key(path))
+
+    def test_OmronTM5_700_fk_stale(self):
+        # generated code that no longer matches the URDF is not used
+        cls = rp.models.URDF.OmronTM5_700
+        module = sys.modules[cls.__module__]
+        stale = SimpleNamespace(fkine=lambda *q: np.eye(4))
+        with mock.patch.object(module, "_fk_single", stale), \
+                mock.patch.object(cls, "_prototype", None):
+            r = cls()
+            with self.assertWarns(UserWarning):
+                r._ensure_loaded()
+            self.assertIsNone(r._fk_specialized)
+
+            q = r.qr + 0.1
+            T = r.ets().eval(q).A
+            nt.assert_array_almost_equal(r.fkine(q).A, T)
+            nt.assert_array_almost_equal(r.fkine_batch(np.array([q, q]))[1], T)
+            nt.assert_array_almost_equal(r.fkine(r.qr).A, r.ets().eval(r.qr).A)
+
+    def test_OmronTM5_700_lazy(self):
+        r = rp.models.URDF.OmronTM5_700()
+        self.assertFalse(r._loaded)
+        self.assertEqual(r.manufacturer, "Omron")
+        self.assertFalse(r._loaded)
+
+        # attributes set before loading are kept
+        r.tool = SE3.Tz(0.1)
+        self.assertFalse(r._loaded)
+
+        self.assertEqual(r.n, 6)
+        self.assertTrue(r._loaded)
+        nt.assert_array_almost_equal(r.tool.A, SE3.Tz(0.1).A)
+
+        with self.assertRaises(AttributeError):
+            r.nosuchattribute
+
+    def test_OmronTM5_700_meshes(self):
+        r = rp.models.URDF.OmronTM5_700()
+        for link in r.links:
+            for shape in link.geometry + link.collision:
+                # referenced by absolute filename, but not yet read
+                self.assertTrue(os.path.isabs(shape.filename))
+                self.assertFalse(shape.pinit)
+
+    def test_OmronTM5_700_fk_specialized(self):
+        r = rp.models.URDF.OmronTM5_700()
+        self.assertIsNotNone(r._fk_specialized)
+
+        q = np.array([0.1, -0.2, 0.3, -0.4, 0.5, -0.6])
+        T = r.ets().eval(q).A
+        nt.assert_array_almost_equal(r.fkine(q).A, T)
+        nt.assert_array_almost_equal(r.fkine(q, fast=True), T)
+
+        # non-allocating variant used by the CUDA kernel
+        from roboticstoolbox.models.URDF import _OmronTM5_700_fk
+        Tout = np.empty((4, 4))
+        _OmronTM5_700_fk.fkine_out(*q, Tout)
+        nt.assert_array_almost_equal(Tout, T)
+
+        r.tool = SE3.Tz(0.1)
+        r.base = SE3.Tx(1)
+        nt.assert_array_almost_equal(
+            r.fkine(q).A, SE3.Tx(1).A @ T @ SE3.Tz(0.1).A)
+
+        # an explicit end link uses the general method
+        nt.assert_array_almost_equal(
+            r.fkine(q, end="flange_link").A,
+            SE3.Tx(1).A @ T @ SE3.Tz(-0.151).A @ SE3.Tz(0.1).A)
+
+        # symbolic joint coordinates use the general method
+        import spatialmath.base.symbolic as sym
+        qs = sym.symbol("q0:6")
+        r2 = rp.models.URDF.OmronTM5_700()
+        r2._ensure_loaded()
+        r2._fk_specialized = None
+        r2.base = r.base
+        r2.tool = r.tool
+        nt.assert_array_equal(r.fkine(qs).A, r2.fkine(qs).A)
+
+        # a different end-effector uses the general method
+        r.tool = None
+        r.ee_links = r.link_dict["flange_link"]
+        Tflange = r.fkine(q, end="flange_link").A
+        nt.assert_array_almost_equal(r.fkine(q).A, Tflange)
+        nt.assert_array_almost_equal(r.fkine(q, fast=True), Tflange)
+        self.assertFalse(np.allclose(r.fkine(q).A, r.fkine(q, end="tool0").A))
+
+    def test_OmronTM5_700_fkine_cached(self):
+        r = rp.models.URDF.OmronTM5_700()
+        T = r.ets().eval(r.qr).A
+        self.assertIn(id(r.qr), r._fk_cache)
+        nt.assert_array_almost_equal(r.fkine(r.qr).A, T)
+        nt.assert_array_almost_equal(r.fkine(r.qr.copy()).A, T)
+
+        r.tool = SE3.Tz(0.1)
+        r.base = SE3.Tx(1)
+        nt.assert_array_almost_equal(
+            r.fkine(r.qr).A, SE3.Tx(1).A @ T @ SE3.Tz(0.1).A)
+        nt.assert_array_almost_equal(
+            r.fkine(r.qr, tool=SE3.Tz(0.2)).A,
+            SE3.Tx(1).A @ T @ SE3.Tz(0.2).A)
+
+        # redefining a configuration replaces its cached pose
+        q = np.array([0.1, -0.2, 0.3, -0.4, 0.5, -0.6])
+        r.addconfiguration("qr", q)
+        self.assertEqual(len(r._fk_cache), 2)
+        nt.assert_array_almost_equal(
+            r.fkine(r.qr).A, SE3.Tx(1).A @ r.ets().eval(q).A @ SE3.Tz(0.1).A)
+
+        # not used for a different end-effector
+        r.ee_links = r.link_dict["flange_link"]
+        nt.assert_array_almost_equal(
+            r.fkine(r.qr).A, r.fkine(r.qr, end="flange_link").A)
+        self.assertFalse(np.allclose(
+            r.fkine(r.qr).A, r.fkine(r.qr, end="tool0").A))
+
+    def test_OmronTM5_700_fkine_batch(self):
+        r = rp.models.URDF.OmronTM5_700()
+        Q = np.random.rand(10, 6)
+
+        T = r.fkine_batch(Q)
+        self.assertEqual(T.shape, (10, 4, 4))
+        for k in range(10):
+            nt.assert_array_almost_equal(T[k], r.fkine(Q[k]).A)
+
+        r.base = SE3.Tx(1)
+        r.tool = SE3.Tz(0.1)
+        T = r.fkine_batch(Q)
+        for k in range(10):
+            nt.assert_array_almost_equal(T[k], r.fkine(Q[k]).A)
+
+    def test_OmronTM5_700_float32(self):
+        r = rp.models.URDF.OmronTM5_700(dtype=np.float32)
+        self.assertEqual(r.configs_matrix.dtype, np.float32)
+        self.assertEqual(r.qr.dtype, np.float32)
+
+        Q = np.random.rand(10, 6)
+        T = r.fkine_batch(Q)
+        self.assertEqual(T.dtype, np.float32)
+        for k in range(10):
+            nt.assert_array_almost_equal(T[k], r.fkine(Q[k]).A, decimal=5)
+
+        with self.assertRaises(ValueError):
+            rp.models.URDF.OmronTM5_700(dtype=np.int32)
+
+    def test_OmronTM5_700_configs_matrix(self):
+        r = rp.models.URDF.OmronTM5_700()
+        Q = r.configs_matrix
+        self.assertEqual(Q.shape, (2, 6))
+        nt.assert_array_almost_equal(Q[0], r.qz)
+        nt.assert_array_almost_equal(Q[1], r.qr)
+
+        # named configurations are read-only views of the matrix
+        self.assertIs(r.qn.base, Q.base)
+        with self.assertRaises(ValueError):
+            r.qr[0] = 1
+        self.assertEqual(len(r.fkine(Q)), 2)
+
+        # qs and qn are aliases of qr
+        self.assertIs(r.qs, r.qr)
+        self.assertIs(r.qn, r.qr)
+
+        # grows beyond the initial capacity
+        for k in range(10):
+            r.addconfiguration(f"q{k}", np.full(6, k))
+        Q = r.configs_matrix
+        self.assertEqual(Q.shape, (12, 6))
+        nt.assert_array_almost_equal(Q[1], r.qr)
+        nt.assert_array_almost_equal(r.q9, np.full(6, 9))
+        self.assertIs(r.qr.base, Q.base)
+
+        r.addconfiguration("qr", np.ones(6))
+        nt.assert_array_almost_equal(r.configs_matrix[1], np.ones(6))
+        self.assertEqual(r.configs_matrix.shape, (12, 6))
+        self.assertIs(r.qn, r.qr)
+
     def test_UR10(self):
         ur = rp.models.UR10()
         ur.qr